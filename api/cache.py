@@ -0,0 +1,198 @@
+import hashlib
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+from api.metrics import metrics
+from src.models.event import Event
+from src.storage.analytics import EventCounters, combined_analytics
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+INDEXED_FIELDS = {
+    "city": lambda e: e.city.lower(),
+    "status": lambda e: e.status,
+    "source": lambda e: e.source.lower(),
+    "category": lambda e: (e.category or "General").lower(),
+}
+
+
+def dataset_version(events: List[Event]) -> str:
+    digest = hashlib.sha1()
+    for e in events:
+        digest.update("\x1f".join(e.to_row()).encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()[:16]
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], object]):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                metrics.incr("response_cache_hits")
+                return self._entries[key]
+        value = build()
+        metrics.incr("response_cache_misses")
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+
+class EventSnapshot:
+    def __init__(
+        self,
+        events: List[Event],
+        counters: Optional[EventCounters] = None,
+        version: Optional[str] = None,
+        generation: int = 1,
+        archived: Optional[EventCounters] = None,
+    ):
+        self.events = events
+        self.counters = counters or EventCounters.from_events(events)
+        self.archived = archived
+        self.version = version or dataset_version(events)
+        self.generation = generation
+        self.responses = ResponseCache()
+        self.search_index = None
+        self.loaded_at = time.time()
+        self.index: Dict[str, Dict[str, List[int]]] = {f: {} for f in INDEXED_FIELDS}
+        self.positions: Dict[str, int] = {}
+        for position, e in enumerate(events):
+            self.positions[e.event_id] = position
+            for name, key in INDEXED_FIELDS.items():
+                self.index[name].setdefault(key(e), []).append(position)
+        self._posting_sets: Dict[tuple, frozenset] = {}
+
+    def analytics(self) -> dict:
+        return combined_analytics(self.counters.to_dict(), self.archived)
+
+    def _posting_set(self, name: str, value: str) -> frozenset:
+        key = (name, value)
+        if key not in self._posting_sets:
+            self._posting_sets[key] = frozenset(self.index[name].get(value, ()))
+        return self._posting_sets[key]
+
+    def query(self, **filters: Optional[str]) -> Sequence[int]:
+        terms = []
+        for name, value in filters.items():
+            if value is None or value == "":
+                continue
+            if name != "status":
+                value = value.lower()
+            terms.append((name, value))
+        if not terms:
+            return range(len(self.events))
+        terms.sort(key=lambda t: len(self.index[t[0]].get(t[1], ())))
+        name, value = terms[0]
+        postings = self.index[name].get(value, [])
+        if len(terms) == 1:
+            return postings
+        others = [self._posting_set(n, v) for n, v in terms[1:]]
+        return [p for p in postings if all(p in s for s in others)]
+
+    def page(self, positions: Sequence[int], limit: int, offset: int = 0, cursor: Optional[str] = None):
+        """One page of ``positions``; ``cursor`` is the event id the previous page ended on.
+
+        The cursor is resolved against this snapshot, so rows added or removed
+        between pages don't shift it. Raises KeyError if that event is gone.
+        """
+        start = offset if cursor is None else bisect_right(positions, self.positions[cursor])
+        selected = positions[start : start + limit]
+        has_more = start + limit < len(positions)
+        next_cursor = self.events[selected[-1]].event_id if selected and has_more else None
+        return [self.events[p] for p in selected], next_cursor
+
+
+class SnapshotCache:
+    def __init__(
+        self,
+        loader: Callable[[], List[Event]],
+        ttl: float,
+        archive_totals: Optional[Callable[[], EventCounters]] = None,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.archive_totals = archive_totals
+        self._snapshot: Optional[EventSnapshot] = None
+        self._expires_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[Callable[[Optional[EventSnapshot], EventSnapshot], None]] = []
+
+    def add_listener(self, listener: Callable[[Optional[EventSnapshot], EventSnapshot], None]):
+        self._listeners.append(listener)
+
+    def get(self) -> EventSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.refresh()
+        if time.monotonic() >= self._expires_at:
+            self._refresh_in_background()
+        return snapshot
+
+    def refresh(self) -> EventSnapshot:
+        with self._refresh_lock:
+            if self._snapshot is not None and time.monotonic() < self._expires_at:
+                return self._snapshot
+            return self._load()
+
+    def set_events(
+        self, events: List[Event], counters: Optional[EventCounters] = None
+    ) -> EventSnapshot:
+        version = dataset_version(events)
+        current = self._snapshot
+        if current is not None and current.version == version:
+            self._expires_at = time.monotonic() + self.ttl
+            return current
+        generation = current.generation + 1 if current is not None else 1
+        archived = self.archive_totals() if self.archive_totals else None
+        snapshot = EventSnapshot(events, counters, version, generation, archived)
+        self._snapshot = snapshot
+        self._expires_at = time.monotonic() + self.ttl
+        for listener in self._listeners:
+            try:
+                listener(current, snapshot)
+            except Exception as e:
+                logger.error(f"Snapshot listener failed: {e}")
+        return snapshot
+
+    def invalidate(self):
+        self._expires_at = 0.0
+        if self._snapshot is not None:
+            # Reload now rather than on the next read so stream subscribers hear about it.
+            self._refresh_in_background()
+
+    def _load(self) -> EventSnapshot:
+        try:
+            with metrics.timer("snapshot_load"):
+                return self.set_events(self.loader())
+        except Exception as e:
+            metrics.incr("snapshot_load_failures")
+            logger.error(f"Snapshot refresh failed: {e}")
+            if self._snapshot is None:
+                raise
+            self._expires_at = time.monotonic() + min(self.ttl, 30)
+            return self._snapshot
+
+    def _refresh_in_background(self):
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                self._load()
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=run, daemon=True).start()
@@ -1,21 +1,91 @@
+import hmac
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 
-from src.storage.google_sheets_storage import GoogleSheetsStorage
+from api.cache import SnapshotCache
+from api.metrics import metrics
+from api.responses import snapshot_response
+from api.scheduler import CrawlScheduler
+from api.search import SearchIndexer, date_bound
+from api.stream import ChangeFeed
+from src.storage import get_storage
+from src.storage.analytics import EventCounters
+from src.storage.archive import EventArchive
+from src.utils.config import config
+from src.utils.metrics import load_report, render_prometheus
 
 
-app = FastAPI(title="Event Scraper API", version="1.0.0")
+storage = None
+crawl_storage = None
+
+
+def get_api_storage():
+    global storage
+    if storage is None:
+        storage = get_storage()
+    return storage
+
+
+archive = EventArchive()
+snapshot_cache = SnapshotCache(
+    lambda: get_api_storage().load_events(),
+    ttl=config.API_CACHE_TTL,
+    archive_totals=archive.totals,
+)
+change_feed = ChangeFeed()
+search_indexer = SearchIndexer()
+snapshot_cache.add_listener(search_indexer.publish_snapshot)
+snapshot_cache.add_listener(change_feed.publish_snapshot)
+
+
+def scheduled_crawl() -> dict:
+    from main import crawl
+
+    global crawl_storage
+    if crawl_storage is None:
+        crawl_storage = get_storage()
+    result = crawl(config.get_scrape_cities(), config.PLATFORMS, storage=crawl_storage)
+    events = result.get("events")
+    if events is None:
+        events = crawl_storage.load_events()
+    # A frozen copy: the next sync keeps updating the storage's counters in place.
+    counters = EventCounters.from_state(crawl_storage.counters.state())
+    snapshot = snapshot_cache.set_events(events, counters)
+    return {"saved": result["saved"], "events": len(snapshot.events)}
+
+
+scheduler = (
+    CrawlScheduler(
+        scheduled_crawl,
+        config.SCRAPE_INTERVAL_MINUTES * 60,
+        run_on_start=config.SCRAPE_ON_STARTUP,
+    )
+    if config.SCRAPE_INTERVAL_MINUTES > 0
+    else None
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if scheduler:
+        scheduler.start()
+    yield
+    if scheduler:
+        scheduler.stop(timeout=5)
+
+
+app = FastAPI(title="Event Scraper API", version="1.0.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
 )
-
-storage = GoogleSheetsStorage()
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
 
 
@@ -29,29 +99,137 @@ def serve_dashboard():
 
 @app.get("/api/events")
 def get_events(
+    request: Request,
     city: str = Query(None),
     status: str = Query(None),
     source: str = Query(None),
+    category: str = Query(None),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: str = Query(None),
+):
+    snapshot = snapshot_cache.get()
+    if cursor is not None and cursor not in snapshot.positions:
+        raise HTTPException(
+            status_code=410, detail="Cursor event no longer exists; restart from the first page"
+        )
+
+    def build():
+        positions = snapshot.query(
+            city=city, status=status, source=source, category=category
+        )
+        events, next_cursor = snapshot.page(positions, limit, offset, cursor)
+        return {
+            "total": len(positions),
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "events": [e.to_dict() for e in events],
+        }
+
+    key = (
+        "events",
+        (city or "").lower(),
+        status or "",
+        (source or "").lower(),
+        (category or "").lower(),
+        limit,
+        offset,
+        cursor,
+    )
+    return snapshot_response(request, snapshot, key, build)
+
+
+@app.get("/api/search")
+def search_events(
+    request: Request,
+    q: str = Query(""),
+    city: str = Query(None),
+    status: str = Query(None),
+    date_from: str = Query(None),
+    date_to: str = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
 ):
-    events = storage.load_events()
-    if city:
-        events = [e for e in events if e.city.lower() == city.lower()]
-    if status:
-        events = [e for e in events if e.status == status]
-    if source:
-        events = [e for e in events if e.source.lower() == source.lower()]
-    total = len(events)
-    events = events[offset : offset + limit]
-    return {
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "events": [e.to_dict() for e in events],
-    }
+    try:
+        starts_after = date_bound(date_from)
+        starts_before = date_bound(date_to, end=True)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    snapshot = snapshot_cache.get()
+
+    def build():
+        index = search_indexer.for_snapshot(snapshot)
+        total, ids = index.search(q, city, status, starts_after, starts_before, offset + limit)
+        return {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "events": [index.events[i].to_dict() for i in ids[offset : offset + limit]],
+        }
+
+    key = (
+        "search",
+        q.strip().lower(),
+        (city or "").lower(),
+        status or "",
+        starts_after,
+        starts_before,
+        limit,
+        offset,
+    )
+    return snapshot_response(request, snapshot, key, build)
 
 
 @app.get("/api/analytics")
-def get_analytics():
-    return storage.get_analytics()
+def get_analytics(request: Request):
+    snapshot = snapshot_cache.get()
+    return snapshot_response(request, snapshot, ("analytics",), snapshot.analytics)
+
+
+@app.get("/api/stream")
+def stream_changes(request: Request, last_event_id: str = Header(None)):
+    return StreamingResponse(
+        change_feed.stream(snapshot_cache.get, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def require_token(x_api_token: Optional[str]):
+    """Guard for endpoints that trigger work; without an API_TOKEN they stay closed."""
+    if not config.API_TOKEN:
+        raise HTTPException(status_code=403, detail="Set API_TOKEN to enable this endpoint")
+    if not x_api_token or not hmac.compare_digest(x_api_token, config.API_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid API token")
+
+
+@app.post("/api/cache/invalidate")
+def invalidate_cache(x_api_token: str = Header(None)):
+    require_token(x_api_token)
+    snapshot_cache.invalidate()
+    return {"invalidated": True}
+
+
+@app.get("/api/scheduler")
+def get_scheduler_status():
+    if not scheduler:
+        return {"enabled": False}
+    return {"enabled": True, **scheduler.status()}
+
+
+@app.post("/api/scheduler/run")
+def trigger_crawl(x_api_token: str = Header(None)):
+    require_token(x_api_token)
+    if not scheduler:
+        raise HTTPException(status_code=404, detail="Scheduler is disabled")
+    return {"triggered": scheduler.trigger()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    body = metrics.to_prometheus(prefix="event_api")
+    report = load_report(config.METRICS_FILE) if config.METRICS_FILE else None
+    if report:
+        body += render_prometheus(report, prefix="event_scraper_last_run")
+    return body
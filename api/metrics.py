@@ -0,0 +1,5 @@
+from src.utils.metrics import Metrics
+
+# The API's own registry, served as event_api_* on /metrics. Crawls running in
+# the API process reset and report the scraper registry without touching it.
+metrics = Metrics()
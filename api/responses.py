@@ -0,0 +1,118 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+
+from api.cache import EventSnapshot
+
+MIN_COMPRESS_BYTES = 1024
+CACHE_CONTROL = "no-cache"
+# In order of preference.
+ENCODINGS = ("br", "gzip")
+
+
+def _brotli():
+    try:
+        import brotli
+
+        return brotli
+    except ImportError:
+        return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _brotli().compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    offered = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            offered[name.strip().lower()] = q
+    for encoding in ENCODINGS:
+        if offered.get(encoding, 0) > 0 and (encoding != "br" or _brotli()):
+            return encoding
+    return None
+
+
+class CachedBody:
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def content_encoding(self, encoding: Optional[str]) -> Optional[str]:
+        """The encoding actually applied; small bodies are always sent as-is."""
+        if encoding is None or len(self.body) < MIN_COMPRESS_BYTES:
+            return None
+        return encoding
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        applied = self.content_encoding(encoding)
+        return self.etag if applied is None else f'{self.etag[:-1]}-{applied}"'
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        applied = self.content_encoding(encoding)
+        if applied is None:
+            return self.body
+        with self._lock:
+            if applied not in self._encoded:
+                self._encoded[applied] = compress(self.body, applied)
+            return self._encoded[applied]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether ``if_none_match`` names ``etag`` or one of its encoded variants."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.strip('"')
+    variants = {opaque} | {f"{opaque}-{encoding}" for encoding in ENCODINGS}
+    for candidate in if_none_match.split(","):
+        value = candidate.strip()
+        if value.startswith("W/"):
+            value = value[2:]
+        if value.strip('"') in variants:
+            return True
+    return False
+
+
+def snapshot_response(
+    request: Request, snapshot: EventSnapshot, key: Hashable, build: Callable[[], object]
+) -> Response:
+    """JSON response for ``key`` serialized once per snapshot version, with ETag/304 and compression."""
+
+    def serialize() -> CachedBody:
+        body = json.dumps(build(), separators=(",", ":")).encode()
+        tag = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        return CachedBody(body, f'"{snapshot.version}-{tag}"')
+
+    cached: CachedBody = snapshot.responses.get_or_build(key, serialize)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    # Each encoding is its own representation, so a 304 names the tag its 200 would carry.
+    headers = {
+        "ETag": cached.etag_for(encoding),
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "X-Data-Generation": str(snapshot.generation),
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    body = cached.encoded(encoding)
+    if body is not cached.body:
+        headers["Content-Encoding"] = cached.content_encoding(encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
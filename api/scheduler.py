@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class CrawlScheduler:
+    def __init__(self, job: Callable[[], Any], interval: float, run_on_start: bool = True):
+        self.job = job
+        self.interval = interval
+        self.run_on_start = run_on_start
+        self.running = False
+        self.runs = 0
+        self.last_started: Optional[float] = None
+        self.last_finished: Optional[float] = None
+        self.last_result: Any = None
+        self.last_error: Optional[str] = None
+        self.next_run: Optional[float] = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._loop, name="crawl-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"Crawl scheduler started (every {self.interval:g}s)")
+
+    def stop(self, timeout: float = None):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def trigger(self) -> bool:
+        if self.running:
+            return False
+        self._wake.set()
+        return True
+
+    def run_now(self):
+        self.running = True
+        self.last_started = time.time()
+        try:
+            self.last_result = self.job()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Scheduled crawl failed: {e}")
+        finally:
+            self.runs += 1
+            self.last_finished = time.time()
+            self.running = False
+
+    def _loop(self):
+        if not self.run_on_start:
+            self._sleep()
+        while not self._stopped.is_set():
+            self.run_now()
+            self._sleep()
+
+    def _sleep(self):
+        self.next_run = time.time() + self.interval
+        self._wake.wait(self.interval)
+        self._wake.clear()
+        self.next_run = None
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "last_started": self.last_started,
+            "last_finished": self.last_finished,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+            "next_run": self.next_run,
+        }
@@ -0,0 +1,259 @@
+import heapq
+import threading
+from collections import Counter
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from api.cache import EventSnapshot
+from api.metrics import metrics
+from src.models.event import Event
+from src.storage.dedup import cached_tokens, tokens
+from src.utils.dates import parse_event_date
+
+
+def date_bound(value: Optional[str], end: bool = False) -> Optional[datetime]:
+    """Parse a date or datetime query value; a bare date as an ``end`` bound includes that day."""
+    if not value:
+        return None
+    parsed = parse_event_date(value)
+    if parsed is None:
+        raise ValueError(f"Invalid date: {value}")
+    if end and not _has_time(value):
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def _has_time(value: str) -> bool:
+    # A value without a time takes the default's hour, so two defaults tell it apart.
+    from dateutil import parser
+
+    try:
+        early = parser.parse(value, default=datetime(2000, 1, 1, 0, 0, 0))
+        late = parser.parse(value, default=datetime(2000, 1, 1, 23, 0, 0))
+    except (ValueError, OverflowError):
+        return True
+    return early.time() == late.time()
+
+
+def _doc_key(e: Event) -> tuple:
+    return (e.event_name, e.venue, e.category, e.city, e.status, e.starts_at)
+
+
+@lru_cache(maxsize=4096)
+def _context_terms(venue: str, category: str, city: str) -> FrozenSet[str]:
+    return cached_tokens(venue) | cached_tokens(category) | cached_tokens(city)
+
+
+class _Doc:
+    __slots__ = ("key", "name", "context", "city", "status", "rank", "sort_key")
+
+    def __init__(self, e: Event, key: tuple):
+        self.key = key
+        self.name = tokens(e.event_name)
+        # Venue, category and city terms; shared between events with the same values.
+        self.context = _context_terms(e.venue, e.category, e.city)
+        self.city = e.city.lower()
+        self.status = e.status
+        self.rank = e.starts_at.timestamp() if e.starts_at else float("inf")
+        self.sort_key = (self.rank, e.event_id)
+
+    @property
+    def terms(self) -> FrozenSet[str]:
+        return self.name | self.context
+
+
+class SearchIndex:
+    """Inverted index from name, venue, category and city tokens to event ids.
+
+    ``updated`` derives the index for a new snapshot from this one, re-tokenizing
+    only events whose indexed fields changed. Posting sets are copied on write,
+    so the previous snapshot's index stays valid for requests still using it.
+    """
+
+    def __init__(self):
+        self.events: Dict[str, Event] = {}
+        self._docs: Dict[str, _Doc] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._name_postings: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._sort_keys: Dict[str, tuple] = {}
+
+    @classmethod
+    def build(cls, events: Iterable[Event]) -> "SearchIndex":
+        with metrics.timer("search_index_build"):
+            index = cls()
+            postings, name_postings = index._postings, index._name_postings
+            by_context: Dict[FrozenSet[str], List[str]] = {}
+            for e in events:
+                index.events[e.event_id] = e
+                doc = index._docs[e.event_id] = _Doc(e, _doc_key(e))
+                for term in doc.name:
+                    postings.setdefault(term, set()).add(e.event_id)
+                    name_postings.setdefault(term, set()).add(e.event_id)
+                by_context.setdefault(doc.context, []).append(e.event_id)
+            for context, ids in by_context.items():
+                for term in context:
+                    postings.setdefault(term, set()).update(ids)
+            index._vocabulary = sorted(postings)
+            index._sort_keys = {i: doc.sort_key for i, doc in index._docs.items()}
+            return index
+
+    def updated(self, events: Iterable[Event]) -> "SearchIndex":
+        with metrics.timer("search_index_update"):
+            index = SearchIndex()
+            index._docs = dict(self._docs)
+            index._postings = dict(self._postings)
+            index._name_postings = dict(self._name_postings)
+            index._vocabulary = self._vocabulary
+            index._apply_changes(events)
+            index._sort_keys = {i: doc.sort_key for i, doc in index._docs.items()}
+            return index
+
+    def _apply_changes(self, events: Iterable[Event]):
+        owned = {id(self._postings): set(), id(self._name_postings): set()}
+
+        def posting(postings: Dict[str, Set[str]], term: str) -> Set[str]:
+            copied = owned[id(postings)]
+            ids = postings.get(term)
+            if ids is None:
+                ids = postings[term] = set()
+            elif term not in copied:
+                ids = postings[term] = set(ids)
+            copied.add(term)
+            return ids
+
+        def index_doc(event_id: str, old: Optional[_Doc], new: Optional[_Doc]):
+            for postings, field in ((self._postings, "terms"), (self._name_postings, "name")):
+                before = getattr(old, field) if old else frozenset()
+                after = getattr(new, field) if new else frozenset()
+                for term in before - after:
+                    posting(postings, term).discard(event_id)
+                for term in after - before:
+                    posting(postings, term).add(event_id)
+
+        stale = set(self._docs)
+        for e in events:
+            self.events[e.event_id] = e
+            stale.discard(e.event_id)
+            key = _doc_key(e)
+            doc = self._docs.get(e.event_id)
+            if doc is not None and doc.key == key:
+                continue
+            new = self._docs[e.event_id] = _Doc(e, key)
+            index_doc(e.event_id, doc, new)
+        for event_id in stale:
+            index_doc(event_id, self._docs.pop(event_id), None)
+        vocabulary_changed = False
+        for postings in (self._postings, self._name_postings):
+            for term in [t for t in owned[id(postings)] if not postings[t]]:
+                del postings[term]
+                vocabulary_changed = True
+        if vocabulary_changed or len(self._vocabulary) != len(self._postings):
+            self._vocabulary = sorted(self._postings)
+
+    def _matching(self, prefix: str, postings: Dict[str, Set[str]]) -> Set[str]:
+        """Union of the postings of every term starting with ``prefix``; not to be mutated."""
+        vocabulary = self._vocabulary
+        sets = []
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix):
+                break
+            ids = postings.get(vocabulary[i])
+            if ids:
+                sets.append(ids)
+        if len(sets) == 1:
+            return sets[0]
+        return set().union(*sets)
+
+    def search(
+        self,
+        text: str = "",
+        city: Optional[str] = None,
+        status: Optional[str] = None,
+        starts_after: Optional[datetime] = None,
+        starts_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[int, List[str]]:
+        """Count and ids of events matching every query token as a word prefix, best first.
+
+        Events whose name contains more of the query tokens rank higher, then
+        earlier start dates. Only the first ``limit`` ids are ranked and returned.
+        """
+        terms = sorted(tokens(text), key=len, reverse=True)
+        candidates: Optional[Set[str]] = None
+        for term in terms:
+            matched = self._matching(term, self._postings)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return 0, []
+        city = city.lower() if city else None
+        for term in cached_tokens(city or ""):
+            matched = self._postings.get(term, set())
+            candidates = matched if candidates is None else candidates & matched
+        ids = self._docs.keys() if candidates is None else candidates
+        dated = starts_after is not None or starts_before is not None
+        if city or status or dated:
+            after = starts_after.timestamp() if starts_after else float("-inf")
+            before = starts_before.timestamp() if starts_before else float("inf")
+            docs = self._docs
+            ids = {
+                event_id
+                for event_id in ids
+                if (not city or docs[event_id].city == city)
+                and (not status or docs[event_id].status == status)
+                and (not dated or after <= docs[event_id].rank < before)
+            }
+        return len(ids), self._ranked(ids, terms, limit)
+
+    def _ranked(self, ids, terms: List[str], limit: Optional[int]) -> List[str]:
+        groups = [ids]
+        if len(terms) == 1:
+            in_name = self._matching(terms[0], self._name_postings).intersection(ids)
+            groups = [in_name, ids - in_name]
+        elif terms:
+            # Bucket by how many query tokens hit the name; set operations keep this in C.
+            hits = Counter()
+            for term in terms:
+                hits.update(self._matching(term, self._name_postings).intersection(ids))
+            by_hits: Dict[int, List[str]] = {}
+            for event_id, count in hits.items():
+                by_hits.setdefault(count, []).append(event_id)
+            groups = [by_hits[count] for count in sorted(by_hits, reverse=True)]
+            groups.append(ids - hits.keys())
+        key = self._sort_keys.__getitem__
+        ranked: List[str] = []
+        for group in groups:
+            if limit is None or len(group) <= limit - len(ranked):
+                ranked.extend(sorted(group, key=key))
+            else:
+                ranked.extend(heapq.nsmallest(limit - len(ranked), group, key=key))
+            if limit is not None and len(ranked) >= limit:
+                break
+        return ranked
+
+
+class SearchIndexer:
+    """Snapshot listener that carries the search index forward between snapshots.
+
+    The first index is built lazily on the first search, so an API that is
+    never searched never pays for it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def for_snapshot(self, snapshot: EventSnapshot) -> SearchIndex:
+        if snapshot.search_index is None:
+            with self._lock:
+                if snapshot.search_index is None:
+                    snapshot.search_index = SearchIndex.build(snapshot.events)
+        return snapshot.search_index
+
+    def publish_snapshot(self, old: Optional[EventSnapshot], new: EventSnapshot):
+        if old is None or old.search_index is None:
+            return
+        with self._lock:
+            if new.search_index is None:
+                new.search_index = old.search_index.updated(new.events)
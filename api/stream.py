@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import AsyncIterator, List, Optional, Tuple
+
+from api.cache import EventSnapshot
+from api.metrics import metrics
+from src.models.event import HEADERS
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LAST_UPDATED = HEADERS.index("Last Updated")
+MAX_DELTA_RECORDS = 1000
+HEARTBEAT_SECONDS = 15.0
+
+
+def _comparable(row: List[str]) -> tuple:
+    return tuple(v for i, v in enumerate(row) if i != LAST_UPDATED)
+
+
+def snapshot_delta(old: EventSnapshot, new: EventSnapshot) -> Optional[dict]:
+    """Rows added, changed (other than last_updated) or removed between two snapshots.
+
+    Returns None when the change is too large to be worth sending as a delta.
+    """
+    before = {e.event_id: _comparable(e.to_row()) for e in old.events}
+    added, updated = [], []
+    for e in new.events:
+        previous = before.pop(e.event_id, None)
+        if previous is None:
+            added.append(e)
+        elif previous != _comparable(e.to_row()):
+            updated.append(e)
+    removed = list(before)
+    if len(added) + len(updated) + len(removed) > MAX_DELTA_RECORDS:
+        return None
+    return {
+        "version": new.version,
+        "generation": new.generation,
+        "previous_generation": old.generation,
+        "added": [e.to_dict() for e in added],
+        "updated": [e.to_dict() for e in updated],
+        "removed": removed,
+        "analytics": new.analytics(),
+    }
+
+
+def sse_message(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def reset_message(snapshot: EventSnapshot) -> str:
+    """Tells a client to refetch; its id moves Last-Event-ID past everything it replaces."""
+    data = {"version": snapshot.version, "generation": snapshot.generation}
+    return sse_message("reset", data, snapshot.generation)
+
+
+class ChangeFeed:
+    def __init__(self, history: int = 20, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._history: "deque[Tuple[int, str]]" = deque(maxlen=history)
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def publish_snapshot(self, old: Optional[EventSnapshot], new: EventSnapshot):
+        if old is None:
+            return
+        delta = snapshot_delta(old, new)
+        if delta is None:
+            message = reset_message(new)
+        else:
+            message = sse_message("delta", delta, new.generation)
+        metrics.incr("stream_messages_published")
+        with self._lock:
+            self._history.append((new.generation, message))
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(self._offer, queue, message, new)
+
+    def _offer(self, queue: asyncio.Queue, message: str, snapshot: EventSnapshot):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Stream subscriber fell {queue.qsize()} messages behind, "
+                f"resetting it to generation {snapshot.generation}"
+            )
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(reset_message(snapshot))
+
+    def backlog(self, last_generation: int, current_generation: int) -> Optional[List[str]]:
+        with self._lock:
+            missed = [m for g, m in self._history if g > last_generation]
+            first = next((g for g, _ in self._history if g > last_generation), None)
+        if last_generation >= current_generation:
+            return []
+        if first != last_generation + 1:
+            return None
+        return missed
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    async def stream(
+        self, snapshot_getter, last_event_id: Optional[str], is_disconnected
+    ) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        entry = (loop, queue)
+        with self._lock:
+            self._subscribers.append(entry)
+        try:
+            snapshot = await loop.run_in_executor(None, snapshot_getter)
+            hello = {"version": snapshot.version, "generation": snapshot.generation}
+            if last_event_id and last_event_id.isdigit():
+                missed = self.backlog(int(last_event_id), snapshot.generation)
+                if missed is None:
+                    yield reset_message(snapshot)
+                else:
+                    for message in missed:
+                        yield message
+            yield sse_message("hello", hello)
+            while not await is_disconnected():
+                try:
+                    yield await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Lets an idle API notice stale data: get() refreshes in the background.
+                    await loop.run_in_executor(None, snapshot_getter)
+                    yield ": keepalive\n\n"
+        finally:
+            with self._lock:
+                self._subscribers.remove(entry)
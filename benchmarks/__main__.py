@@ -0,0 +1,70 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from functools import partial
+
+from benchmarks.harness import compare, format_table, run_scenario
+from benchmarks.scenarios import SCENARIOS, Options
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks")
+    p.add_argument("scenarios", nargs="*", help=f"Any of: {', '.join(SCENARIOS)} (default: all)")
+    p.add_argument("--pages", type=int, default=Options.pages, help="Listing pages in the fake site")
+    p.add_argument("--latency-ms", type=float, default=0, help="Simulated latency per HTTP request")
+    p.add_argument("--sheets-latency-ms", type=float, default=0, help="Simulated latency per Sheets call")
+    p.add_argument("--api-events", type=int, default=Options.api_events)
+    p.add_argument("--api-requests", type=int, default=Options.api_requests)
+    p.add_argument("--expiry-rows", type=int, default=Options.expiry_rows)
+    p.add_argument("--no-memory", action="store_true", help="Skip the traced pass that measures peak memory")
+    p.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    p.add_argument("--compare", dest="baseline", help="Baseline JSON from an earlier --json run")
+    p.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression vs baseline")
+    args = p.parse_args(argv)
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        p.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    logging.disable(logging.WARNING)
+    options = Options(
+        pages=args.pages,
+        latency=args.latency_ms / 1000,
+        sheets_latency=args.sheets_latency_ms / 1000,
+        api_events=args.api_events,
+        api_requests=args.api_requests,
+        expiry_rows=args.expiry_rows,
+    )
+    results = []
+    for name in args.scenarios or SCENARIOS:
+        print(f"running {name}...", file=sys.stderr)
+        results.append(
+            run_scenario(name, partial(SCENARIOS[name], options), trace_memory=not args.no_memory)
+        )
+    print(format_table(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {
+                    "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python": platform.python_version(),
+                    "options": vars(options),
+                    "results": [r.to_dict() for r in results],
+                },
+                f,
+                indent=2,
+            )
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from string import Template
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from src.models.event import Event
+from src.utils.config import config
+from src.utils.http_client import FALLBACK_USER_AGENT, UserAgentPool
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BASE_URL = "https://www.district.in/events/"
+CATEGORIES = ["Music", "Comedy", "Workshops", "Theatre", "Sports", "Festivals"]
+VENUES = [
+    ("NSCI Dome", "Worli, Mumbai"),
+    ("Jio World Garden", "Bandra Kurla Complex, Mumbai"),
+    ("Phoenix Marketcity", "Whitefield, Bangalore"),
+    ("Gymkhana Club", "Sector 52, Gurugram"),
+    ("Jawaharlal Nehru Stadium", "Lodhi Road, Delhi"),
+    ("HITEX Exhibition Centre", "Madhapur, Hyderabad"),
+    ("The Habitat", "Khar West, Mumbai"),
+    ("Phoenix Palladium", "Lower Parel, Mumbai"),
+]
+A1_RE = re.compile(r"([A-Z]+)(\d+)")
+
+
+def load_fixture(name: str) -> Template:
+    return Template((FIXTURES_DIR / name).read_text())
+
+
+def _col_number(letters: str) -> int:
+    number = 0
+    for ch in letters:
+        number = number * 26 + ord(ch) - ord("A") + 1
+    return number
+
+
+class FakeSite:
+    """Renders District-style listing and event pages from the HTML fixtures."""
+
+    def __init__(
+        self,
+        pages: int = 4,
+        per_page: int = 24,
+        city: str = "Mumbai",
+        fallback_every: int = 10,
+        latency: float = 0.0,
+        start: datetime = None,
+    ):
+        self.pages = pages
+        self.per_page = per_page
+        self.city = city
+        self.fallback_every = fallback_every
+        self.latency = latency
+        self.start = start or datetime(2026, 1, 1, 19, 30)
+        self.revisions: Dict[int, int] = {}
+        self.requests = Counter()
+        self._listing = load_fixture("listing.html")
+        self._card = load_fixture("listing_card.html")
+        self._event = load_fixture("event.html")
+        self._lock = threading.Lock()
+
+    def listing_url(self, page: int) -> str:
+        return BASE_URL if page == 1 else f"{BASE_URL}?page={page}"
+
+    def event_url(self, index: int) -> str:
+        return f"{BASE_URL}{self._slug(index)}"
+
+    def _slug(self, index: int) -> str:
+        return f"bench-event-{index:05d}"
+
+    def _event_data(self, index: int) -> dict:
+        venue_name, address = VENUES[index % len(VENUES)]
+        revision = self.revisions.get(index, 0)
+        fallback = self.fallback_every and index % self.fallback_every == 0
+        start = self.start + timedelta(days=index % 120, hours=index % 5)
+        return {
+            "slug": self._slug(index),
+            "name": f"Bench Event {index}" + (f" (rev {revision})" if revision else ""),
+            "venue_name": venue_name,
+            "address": address,
+            "venue": venue_name if fallback else f"{venue_name}, {address}",
+            "locality": None if fallback else address.split(", ")[-1],
+            "category": CATEGORIES[index % len(CATEGORIES)],
+            "start": start.strftime("%Y-%m-%dT%H:%M:%S+05:30"),
+            "end": (start + timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M:%S+05:30"),
+            "date_label": start.strftime("%a, %d %b %Y, %I:%M %p"),
+            "price": 299 + (index % 7) * 100,
+        }
+
+    def render_listing(self, page: int) -> str:
+        first = (page - 1) * self.per_page
+        cards = "".join(
+            self._card.substitute(self._event_data(i))
+            for i in range(first, first + self.per_page)
+        )
+        has_next = page < self.pages
+        next_url = self.listing_url(page + 1)
+        pagination = "".join(
+            f'    <a href="{self.listing_url(p)}">{p}</a>\n'
+            for p in range(1, self.pages + 1)
+        )
+        return self._listing.substitute(
+            city=self.city,
+            page=page,
+            cards=cards,
+            pagination=pagination,
+            rel_next=f'<link rel="next" href="{next_url}">' if has_next else "",
+        )
+
+    def render_event(self, index: int) -> str:
+        data = self._event_data(index)
+        location = {"@type": "Place", "name": data["venue"]}
+        if data["locality"]:
+            location["address"] = {
+                "@type": "PostalAddress",
+                "streetAddress": data["address"],
+                "addressLocality": data["locality"],
+                "addressCountry": "IN",
+            }
+        ld_json = {
+            "@context": "https://schema.org",
+            "@type": "Event",
+            "name": data["name"],
+            "startDate": data["start"],
+            "endDate": data["end"],
+            "eventType": data["category"],
+            "location": location,
+            "offers": {"@type": "Offer", "price": data["price"], "priceCurrency": "INR"},
+        }
+        description = "\n".join(
+            f"      <p>{data['name']} returns for another evening of live "
+            f"{data['category'].lower()} at {data['venue_name']}. Part {n} of the "
+            "line-up announcement, with doors opening an hour before the show.</p>"
+            for n in range(1, 9)
+        )
+        related = "\n".join(
+            f'    <a href="/events/{self._slug(j)}">Bench Event {j}</a>'
+            for j in range(index + 1, index + 7)
+        )
+        next_data = json.dumps(
+            {
+                "props": {"pageProps": {"event": ld_json, "related": list(range(index, index + 40))}},
+                "page": "/events/[slug]",
+                "buildId": "bench",
+            }
+        )
+        return self._event.substitute(
+            data,
+            ld_json=json.dumps(ld_json),
+            description=description,
+            related=related,
+            next_data=next_data,
+        )
+
+    def touch(self, indexes: Iterable[int]):
+        for index in indexes:
+            self.revisions[index] = self.revisions.get(index, 0) + 1
+
+    def respond(self, url: str, headers: Optional[dict] = None) -> "FakeResponse":
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests[url] += 1
+        body = self._render(url)
+        if body is None:
+            return FakeResponse(url, 404, "")
+        etag = '"%s"' % hashlib.sha1(body.encode()).hexdigest()
+        if headers and headers.get("If-None-Match") == etag:
+            return FakeResponse(url, 304, "", {"ETag": etag})
+        return FakeResponse(url, 200, body, {"ETag": etag})
+
+    def _render(self, url: str) -> Optional[str]:
+        if url == BASE_URL:
+            return self.render_listing(1)
+        match = re.fullmatch(re.escape(BASE_URL) + r"\?page=(\d+)", url)
+        if match and 1 <= int(match.group(1)) <= self.pages:
+            return self.render_listing(int(match.group(1)))
+        match = re.fullmatch(re.escape(BASE_URL) + r"bench-event-(\d+)", url)
+        if match and int(match.group(1)) < self.pages * self.per_page:
+            return self.render_event(int(match.group(1)))
+        return None
+
+
+class FakeResponse:
+    def __init__(self, url: str, status_code: int, text: str, headers: dict = None):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode()
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class FakeHttpClient:
+    """Stands in for HttpClient, serving pages from a FakeSite."""
+
+    def __init__(self, site: FakeSite):
+        self.site = site
+        self.user_agents = UserAgentPool([FALLBACK_USER_AGENT])
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: int = 30, headers: Optional[dict] = None):
+        response = self.site.respond(url, headers)
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += len(response.content)
+        response.raise_for_status()
+        return response
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "bytes_downloaded": self.bytes_downloaded}
+
+    def close(self):
+        pass
+
+
+class FakeWorksheet:
+    """In-memory stand-in for the gspread Worksheet calls GoogleSheetsStorage makes."""
+
+    def __init__(self, rows: List[List[str]] = None, row_count: int = 1000, latency: float = 0.0):
+        self.rows: List[List[str]] = [list(r) for r in rows or []]
+        self.row_count = max(row_count, len(self.rows))
+        self.latency = latency
+        self.calls = Counter()
+        self.cells_read = 0
+        self.cells_written = 0
+
+    def _call(self, name: str):
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _write(self, row: int, col: int, values: List[List[str]]):
+        for r, row_values in enumerate(values):
+            index = row - 1 + r
+            while len(self.rows) <= index:
+                self.rows.append([])
+            target = self.rows[index]
+            needed = col - 1 + len(row_values)
+            if len(target) < needed:
+                target.extend([""] * (needed - len(target)))
+            target[col - 1 : needed] = [str(v) for v in row_values]
+            self.cells_written += len(row_values)
+        self.row_count = max(self.row_count, len(self.rows))
+
+    def _start(self, a1_range: str):
+        letters, number = A1_RE.match(a1_range.split(":")[0]).groups()
+        return int(number), _col_number(letters)
+
+    def get_all_values(self) -> List[List[str]]:
+        self._call("get_all_values")
+        width = max((len(r) for r in self.rows), default=0)
+        values = [r + [""] * (width - len(r)) for r in self.rows]
+        self.cells_read += width * len(values)
+        return values
+
+    def batch_update(self, data: List[dict], value_input_option: str = None):
+        self._call("batch_update")
+        for item in data:
+            self._write(*self._start(item["range"]), item["values"])
+
+    def append_rows(self, values: List[List[str]], value_input_option: str = None, table_range: str = None):
+        self._call("append_rows")
+        self._write(len(self.rows) + 1, 1, values)
+
+    def update(self, range_name: str, values: List[List[str]], value_input_option: str = None):
+        self._call("update")
+        self._write(*self._start(range_name), values)
+
+    def clear(self):
+        self._call("clear")
+        self.rows = []
+
+    def delete_rows(self, start_index: int, end_index: int = None):
+        self._call("delete_rows")
+        del self.rows[start_index - 1 : end_index or start_index]
+        self.row_count -= (end_index or start_index) - start_index + 1
+
+    def stats(self) -> dict:
+        return {
+            "calls": dict(self.calls),
+            "cells_read": self.cells_read,
+            "cells_written": self.cells_written,
+        }
+
+
+def make_events(
+    count: int, start: int = 0, past_fraction: float = 0.0, now: datetime = None
+) -> List[Event]:
+    """Events with distinct ids; the first ``past_fraction`` of them already started."""
+    now = now or datetime.now()
+    past = int(count * past_fraction)
+    cities = config.SUPPORTED_CITIES
+    events = []
+    for i in range(start, start + count):
+        offset = -(i % 60) - 1 if i - start < past else (i % 90) + 1
+        venue_name, address = VENUES[i % len(VENUES)]
+        events.append(
+            Event(
+                event_name=f"Bench Event {i}",
+                date=(now + timedelta(days=offset)).strftime("%Y-%m-%dT%H:%M:%S+05:30"),
+                venue=f"{venue_name}, {address}",
+                city=cities[i % len(cities)],
+                category=CATEGORIES[i % len(CATEGORIES)],
+                url=f"{BASE_URL}bench-event-{i:05d}",
+                source="District",
+            )
+        )
+    return events
@@ -0,0 +1,134 @@
+import gc
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+
+from src.utils.metrics import metrics
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.ops = 0
+
+    @contextmanager
+    def measure(self, ops: int = 1) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+            self.ops += ops
+
+    def wrap(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.measure():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+@dataclass
+class Result:
+    name: str
+    ops: int
+    seconds: float
+    latencies: List[float]
+    peak_bytes: Optional[int] = None
+    extra: Dict = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.ops / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "seconds": round(self.seconds, 4),
+            "throughput": round(self.throughput, 2),
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 3),
+            "peak_mb": round(self.peak_bytes / 2**20, 2) if self.peak_bytes is not None else None,
+            "extra": self.extra,
+        }
+
+
+def _peak_memory(setup: Callable[[], Callable[[Recorder], dict]]) -> int:
+    run = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(Recorder())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(
+    name: str, setup: Callable[[], Callable[[Recorder], dict]], trace_memory: bool = True
+) -> Result:
+    """Build the scenario's fixtures untimed, then time only its run step.
+
+    tracemalloc slows allocation-heavy code several times over, so peak memory
+    comes from a second, separately traced run on fresh fixtures.
+    """
+    run = setup()
+    recorder = Recorder()
+    metrics.reset()
+    gc.collect()
+    start = time.perf_counter()
+    extra = run(recorder) or {}
+    seconds = time.perf_counter() - start
+    summary = metrics.summary()
+    extra.setdefault("counters", summary["counters"])
+    extra.setdefault("timers", summary["timers"])
+    peak = _peak_memory(setup) if trace_memory else None
+    return Result(name, recorder.ops, seconds, recorder.latencies, peak, extra)
+
+
+def format_table(results: List[Result]) -> str:
+    header = f"{'scenario':<16}{'ops':>8}{'seconds':>10}{'ops/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        d = result.to_dict()
+        peak = f"{d['peak_mb']:.2f}" if d["peak_mb"] is not None else "-"
+        lines.append(
+            f"{d['name']:<16}{d['ops']:>8}{d['seconds']:>10.3f}{d['throughput']:>11.1f}"
+            f"{d['p50_ms']:>10.3f}{d['p95_ms']:>10.3f}{d['p99_ms']:>10.3f}{peak:>10}"
+        )
+    return "\n".join(lines)
+
+
+def compare(results: List[Result], baseline_path: str, tolerance: float) -> List[str]:
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get(result.name)
+        if not old:
+            continue
+        new = result.to_dict()
+        if old["throughput"] and new["throughput"] < old["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: throughput {new['throughput']} < baseline {old['throughput']}"
+            )
+        if old["p95_ms"] and new["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result.name}: p95 {new['p95_ms']}ms > baseline {old['p95_ms']}ms")
+        if old.get("peak_mb") and new["peak_mb"] and new["peak_mb"] > old["peak_mb"] * (1 + tolerance):
+            regressions.append(f"{result.name}: peak {new['peak_mb']}MB > baseline {old['peak_mb']}MB")
+    return regressions
@@ -0,0 +1,286 @@
+import atexit
+import json
+import shutil
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict
+
+from benchmarks.fakes import FakeHttpClient, FakeSite, FakeWorksheet, make_events
+from benchmarks.harness import Recorder
+from src.models.event import HEADERS
+from src.scrapers.district_scraper import DistrictScraper
+from src.scrapers.orchestrator import ScrapeOrchestrator
+from src.storage.google_sheets_storage import GoogleSheetsStorage
+from src.utils.config import config
+from src.utils.fingerprints import FingerprintStore
+from src.utils.http_cache import HttpCache
+from src.utils.rate_limiter import HostRateLimiter
+
+
+@dataclass
+class Options:
+    pages: int = 10
+    per_page: int = 24
+    latency: float = 0.0
+    api_events: int = 20000
+    api_requests: int = 2000
+    expiry_rows: int = 100000
+    sheets_latency: float = 0.0
+
+
+@contextmanager
+def override_config(**values):
+    previous = {name: getattr(config, name) for name in values}
+    for name, value in values.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(config, name, value)
+
+
+class Crawler:
+    def __init__(self, options: Options):
+        self.options = options
+        self.site = FakeSite(
+            pages=options.pages, per_page=options.per_page, latency=options.latency
+        )
+        self.cache_dir = Path(tempfile.mkdtemp(prefix="bench-cache-"))
+        atexit.register(shutil.rmtree, self.cache_dir, True)
+
+    def crawl(self, recorder: Recorder = None) -> dict:
+        client = FakeHttpClient(self.site)
+        scraper = DistrictScraper(
+            self.site.city,
+            rate_limiter=HostRateLimiter(0),
+            http_client=client,
+            http_cache=HttpCache(self.cache_dir / "http", 100 * 2**20, 72 * 3600),
+            fingerprints=FingerprintStore(self.cache_dir / "fingerprints.json"),
+        )
+        if recorder:
+            scraper.scrape_event = recorder.wrap(scraper.scrape_event)
+        with override_config(MAX_EVENTS=0, MAX_LISTING_PAGES=self.options.pages):
+            events = ScrapeOrchestrator([scraper]).run()
+        return {"events": len(events), "http": client.stats()}
+
+
+def cold_crawl(options: Options) -> Callable[[Recorder], dict]:
+    return Crawler(options).crawl
+
+
+def warm_recrawl(options: Options) -> Callable[[Recorder], dict]:
+    crawler = Crawler(options)
+    crawler.crawl()
+    total = options.pages * options.per_page
+    crawler.site.touch(range(0, total, 10))
+    return crawler.crawl
+
+
+def sheets_storage(worksheet: FakeWorksheet) -> GoogleSheetsStorage:
+    storage = GoogleSheetsStorage()
+    storage._worksheet = worksheet
+    return storage
+
+
+def merge(rows: int) -> Callable[[Options], Callable[[Recorder], dict]]:
+    def setup(options: Options) -> Callable[[Recorder], dict]:
+        now = datetime.now()
+        existing = make_events(rows, now=now)
+        worksheet = FakeWorksheet(
+            [HEADERS] + [e.to_row() for e in existing], latency=options.sheets_latency
+        )
+        incoming = make_events(rows // 10, now=now) + make_events(
+            rows // 10, start=rows, now=now
+        )
+        del existing
+
+        def run(recorder: Recorder) -> dict:
+            storage = sheets_storage(worksheet)
+            storage._write_delta = recorder.wrap(storage._write_delta)
+            result = storage.sync_stream(iter(incoming), config.SAVE_BATCH_SIZE)
+            recorder.ops = len(incoming)
+            result["events"] = len(result["events"])
+            return {"result": result, "sheets": worksheet.stats()}
+
+        return run
+
+    return setup
+
+
+def expiry_sweep(options: Options) -> Callable[[Recorder], dict]:
+    rows = options.expiry_rows
+    events = make_events(rows, past_fraction=0.5)
+    worksheet = FakeWorksheet(
+        [HEADERS] + [e.to_row() for e in events], latency=options.sheets_latency
+    )
+    del events
+
+    def run(recorder: Recorder) -> dict:
+        storage = sheets_storage(worksheet)
+        with recorder.measure(ops=rows):
+            expired = storage.mark_expired_events()
+        return {"expired": expired, "sheets": worksheet.stats()}
+
+    return run
+
+
+def _api(options: Options):
+    import api.main as api_main
+    from api.cache import SnapshotCache
+
+    events = make_events(options.api_events, past_fraction=0.3)
+    GoogleSheetsStorage().expire_events(events)
+    api_main.snapshot_cache = SnapshotCache(lambda: events, ttl=3600)
+    api_main.snapshot_cache.get()
+    return api_main
+
+
+EVENT_QUERIES = [
+    {},
+    {"city": "Mumbai"},
+    {"status": "Active"},
+    {"status": "Active", "category": "Music"},
+    {"source": "District", "limit": 500},
+    {"city": "delhi", "status": "Expired", "offset": 50},
+]
+
+
+def http_request(headers: Dict[str, str] = None):
+    from starlette.requests import Request
+
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        }
+    )
+
+
+EVENT_DEFAULTS = dict(
+    city=None, status=None, source=None, category=None, limit=100, offset=0, cursor=None
+)
+
+
+def api_events(options: Options) -> Callable[[Recorder], dict]:
+    api_main = _api(options)
+    compressed = http_request({"Accept-Encoding": "gzip, br"})
+    plain = http_request()
+
+    def run(recorder: Recorder) -> dict:
+        cursor = None
+        body_bytes = 0
+        for i in range(options.api_requests):
+            paging = i % 4 == 3
+            if paging:
+                params = dict(EVENT_DEFAULTS, status="Active", cursor=cursor)
+            else:
+                params = dict(EVENT_DEFAULTS, **EVENT_QUERIES[i % len(EVENT_QUERIES)])
+            with recorder.measure():
+                response = api_main.get_events(plain if paging else compressed, **params)
+            if paging:
+                cursor = json.loads(response.body)["next_cursor"]
+            body_bytes += len(response.body)
+        return {"snapshot_events": options.api_events, "response_bytes": body_bytes}
+
+    return run
+
+
+def api_analytics(options: Options) -> Callable[[Recorder], dict]:
+    api_main = _api(options)
+    request = http_request({"Accept-Encoding": "gzip, br"})
+
+    def run(recorder: Recorder) -> dict:
+        for _ in range(options.api_requests):
+            with recorder.measure():
+                api_main.get_analytics(request)
+        return {"snapshot_events": options.api_events}
+
+    return run
+
+
+SEARCH_QUERIES = [
+    {"q": "comedy"},
+    {"q": "mus", "city": "Mumbai"},
+    {"q": "bench event 12"},
+    {"q": "nsci dome"},
+    {"q": "workshop", "date_from": "2026-01-01", "date_to": "2030-12-31"},
+    {"q": "", "city": "delhi", "status": "Active"},
+]
+SEARCH_DEFAULTS = dict(
+    q="", city=None, status=None, date_from=None, date_to=None, limit=50, offset=0
+)
+
+
+def api_search(options: Options) -> Callable[[Recorder], dict]:
+    """Search over the snapshot; offsets vary so most requests miss the response cache."""
+    api_main = _api(options)
+    snapshot = api_main.snapshot_cache.get()
+    started = time.perf_counter()
+    index = api_main.search_indexer.for_snapshot(snapshot)
+    build_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    index.updated(snapshot.events[1:] + make_events(10, start=options.api_events))
+    update_seconds = time.perf_counter() - started
+    request = http_request({"Accept-Encoding": "gzip, br"})
+
+    def run(recorder: Recorder) -> dict:
+        for i in range(options.api_requests):
+            params = dict(SEARCH_DEFAULTS, **SEARCH_QUERIES[i % len(SEARCH_QUERIES)])
+            params["offset"] = (i // len(SEARCH_QUERIES)) % 50 * 10
+            with recorder.measure():
+                api_main.search_events(request, **params)
+        return {
+            "snapshot_events": options.api_events,
+            "index_build_seconds": round(build_seconds, 3),
+            "index_update_seconds": round(update_seconds, 3),
+        }
+
+    return run
+
+
+def api_poll(options: Options) -> Callable[[Recorder], dict]:
+    """Dashboard polling: every request after the first revalidates with If-None-Match."""
+    api_main = _api(options)
+    first = http_request({"Accept-Encoding": "gzip, br"})
+    params = dict(EVENT_DEFAULTS, limit=200)
+    etags = {
+        "events": api_main.get_events(first, **params).headers["etag"],
+        "analytics": api_main.get_analytics(first).headers["etag"],
+    }
+    events_request = http_request({"Accept-Encoding": "gzip, br", "If-None-Match": etags["events"]})
+    analytics_request = http_request(
+        {"Accept-Encoding": "gzip, br", "If-None-Match": etags["analytics"]}
+    )
+
+    def run(recorder: Recorder) -> dict:
+        statuses = Counter()
+        for _ in range(options.api_requests // 2):
+            with recorder.measure():
+                statuses[api_main.get_events(events_request, **params).status_code] += 1
+            with recorder.measure():
+                statuses[api_main.get_analytics(analytics_request).status_code] += 1
+        return {"snapshot_events": options.api_events, "statuses": dict(statuses)}
+
+    return run
+
+
+SCENARIOS: Dict[str, Callable[[Options], Callable[[Recorder], dict]]] = {
+    "cold_crawl": cold_crawl,
+    "warm_recrawl": warm_recrawl,
+    "merge_10k": merge(10_000),
+    "merge_100k": merge(100_000),
+    "expiry_sweep": expiry_sweep,
+    "api_events": api_events,
+    "api_analytics": api_analytics,
+    "api_search": api_search,
+    "api_poll": api_poll,
+}
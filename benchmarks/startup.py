@@ -0,0 +1,83 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+ENTRY_POINTS = {"main": "import main", "api": "import api.main"}
+
+
+def import_profile(statement: str) -> Tuple[float, List[Tuple[str, int]]]:
+    """Run ``statement`` in a fresh interpreter; return wall seconds and -X importtime rows."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, name = match.groups()
+            rows.append((name, int(self_us)))
+    return wall, rows
+
+
+def by_package(rows) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def report(name: str, statement: str, runs: int, top: int) -> List[str]:
+    walls = []
+    packages: Dict[str, List[int]] = defaultdict(list)
+    imports_us = []
+    for _ in range(runs):
+        wall, rows = import_profile(statement)
+        walls.append(wall)
+        imports_us.append(sum(self_us for _, self_us in rows))
+        for package, self_us in by_package(rows).items():
+            packages[package].append(self_us)
+    lines = [
+        f"{name}: `{statement}`",
+        f"  process wall  {statistics.median(walls) * 1000:8.1f} ms (median of {runs})",
+        f"  imports       {statistics.median(imports_us) / 1000:8.1f} ms",
+        "  top packages by self import time:",
+    ]
+    ranked = sorted(packages.items(), key=lambda kv: -statistics.median(kv[1]))
+    for package, values in ranked[:top]:
+        lines.append(f"    {package:<28}{statistics.median(values) / 1000:8.1f} ms")
+    return lines
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Cold-start import report for the cron entry point and the API",
+    )
+    p.add_argument("targets", nargs="*", help=f"Any of: {', '.join(ENTRY_POINTS)} (default: all)")
+    p.add_argument("--runs", type=int, default=3)
+    p.add_argument("--top", type=int, default=12)
+    args = p.parse_args(argv)
+    unknown = [t for t in args.targets if t not in ENTRY_POINTS]
+    if unknown:
+        p.error(f"unknown target(s): {', '.join(unknown)}")
+    for target in args.targets or ENTRY_POINTS:
+        print("\n".join(report(target, ENTRY_POINTS[target], args.runs, args.top)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
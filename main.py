@@ -1,9 +1,19 @@
+import time
+
+IMPORT_STARTED = time.perf_counter()
+
 from typing import List
 from pathlib import Path
 
 from src.utils.config import config
 from src.scrapers.district_scraper import DistrictScraper
-from src.storage.google_sheets_storage import GoogleSheetsStorage
+from src.scrapers.orchestrator import ScrapeOrchestrator
+from src.storage import BaseStorage, get_storage
+from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+_startup_pending = True
 
 
 def get_scrapers(city: str, platforms: List[str]):
@@ -15,30 +25,86 @@ def get_scrapers(city: str, platforms: List[str]):
     ]
 
 
-def run_once(city: str, platforms: List[str] | None = None) -> int:
-    if not config.GOOGLE_SHEETS_ID or not config.GOOGLE_CREDENTIALS:
+def run_once(
+    cities: str | List[str],
+    platforms: List[str] | None = None,
+    storage: BaseStorage | None = None,
+) -> int:
+    return crawl(cities, platforms, storage)["saved"]
+
+
+def crawl(
+    cities: str | List[str],
+    platforms: List[str] | None = None,
+    storage: BaseStorage | None = None,
+) -> dict:
+    """Scrape, sync and report one run; returns the storage's ``sync_stream`` result."""
+    needs_sheets = config.STORAGE_BACKEND == "sheets" or config.SHEETS_EXPORT
+    if needs_sheets and (not config.GOOGLE_SHEETS_ID or not config.GOOGLE_CREDENTIALS):
         raise ValueError("Set GOOGLE_SHEETS_ID and GOOGLE_CREDENTIALS_FILE in .env")
 
+    if isinstance(cities, str):
+        cities = [cities]
     platforms = platforms or config.PLATFORMS
-    events = []
-    for scraper in get_scrapers(city, platforms):
-        events.extend(scraper.scrape())
+    scrapers = [s for city in cities for s in get_scrapers(city, platforms)]
+    events = ScrapeOrchestrator(scrapers).iter_events()
+
+    global _startup_pending
+    metrics.reset()
+    if _startup_pending:
+        metrics.observe("startup", time.perf_counter() - IMPORT_STARTED)
+        _startup_pending = False
+    storage = storage or get_storage()
+    from src.utils.http_client import get_http_client
+
+    http = get_http_client()
+    http_before = http.stats()
+    with metrics.timer("run"):
+        result = storage.sync_stream(events, config.SAVE_BATCH_SIZE)
+        storage.wait_for_export()
+    http.publish_stats(http_before)
+    metrics.incr("events_saved", result["saved"])
+    metrics.incr("events_expired", result["expired"])
+    report_metrics()
+    notify_api()
+    return result
+
+
+def report_metrics():
+    logger.info(f"Run metrics: {metrics.to_json()}")
+    if not config.METRICS_FILE:
+        return
+    try:
+        metrics.write_report(config.METRICS_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write metrics report: {e}")
+
 
-    if not events:
-        return 0
+def notify_api():
+    if not config.API_INVALIDATE_URL:
+        return
+    if not config.API_TOKEN:
+        logger.warning("API_INVALIDATE_URL is set but API_TOKEN is empty; not invalidating")
+        return
+    from src.utils.http_client import get_http_client
 
-    storage = GoogleSheetsStorage()
-    storage.save_events(events)
-    storage.mark_expired_events()
-    return len(events)
+    try:
+        get_http_client().session.post(
+            config.API_INVALIDATE_URL,
+            headers={"X-API-Token": config.API_TOKEN},
+            timeout=config.REQUEST_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning(f"Could not invalidate API cache: {e}")
 
 
 if __name__ == "__main__":
     import argparse
 
     p = argparse.ArgumentParser()
-    p.add_argument("--city", default=config.DEFAULT_CITY)
+    p.add_argument("--city", default=None)
     p.add_argument("--platforms", default=",".join(config.PLATFORMS))
     args = p.parse_args()
     platforms = [x.strip() for x in args.platforms.split(",") if x.strip()]
-    run_once(args.city, platforms)
+    cities = [c.strip() for c in args.city.split(",")] if args.city else None
+    run_once(cities or config.get_scrape_cities(), platforms)
@@ -11,7 +11,8 @@ def main():
     import uvicorn
     from api.main import app
 
-    run_once(config.DEFAULT_CITY, config.PLATFORMS)
+    if config.SCRAPE_INTERVAL_MINUTES <= 0:
+        run_once(config.get_scrape_cities(), config.PLATFORMS)
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 
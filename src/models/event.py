@@ -1,10 +1,41 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 import hashlib
+import sys
 
+from src.utils.dates import from_iso, parse_event_date, to_utc_iso
+from src.utils.logger import setup_logger
 
-@dataclass
+logger = setup_logger(__name__)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+HEADERS = [
+    "Event ID",
+    "Event Name",
+    "Date",
+    "Venue",
+    "City",
+    "Category",
+    "URL",
+    "Source",
+    "Status",
+    "Last Updated",
+    "Starts At",
+    "Ends At",
+]
+
+
+def parse_timestamp(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, TIMESTAMP_FORMAT)
+    except ValueError:
+        parsed = parse_event_date(value)
+        return parsed.replace(tzinfo=None) if parsed else datetime.now()
+
+
+@dataclass(slots=True)
 class Event:
     event_name: str
     date: str
@@ -16,25 +47,124 @@ class Event:
     status: str = "Active"
     last_updated: datetime = field(default_factory=datetime.now)
     event_id: Optional[str] = None
+    starts_at: Optional[datetime] = None
+    ends_at: Optional[datetime] = None
+    _timestamp_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
+        self.city = sys.intern(self.city)
+        self.source = sys.intern(self.source)
+        self.category = sys.intern(self.category)
+        self.status = sys.intern(self.status)
         if not self.event_id:
             self.event_id = self._generate_id()
+        if self.starts_at is None:
+            self.starts_at = parse_event_date(self.date)
 
     def _generate_id(self) -> str:
         text = f"{self.event_name}_{self.date}_{self.venue}_{self.city}"
         return hashlib.md5(text.encode()).hexdigest()[:12]
 
+    def _timestamps(self) -> tuple:
+        cache = self._timestamp_cache
+        if (
+            cache is None
+            or cache[0] is not self.last_updated
+            or cache[1] is not self.starts_at
+            or cache[2] is not self.ends_at
+        ):
+            cache = (
+                self.last_updated,
+                self.starts_at,
+                self.ends_at,
+                self.last_updated.strftime(TIMESTAMP_FORMAT),
+                to_utc_iso(self.starts_at),
+                to_utc_iso(self.ends_at),
+            )
+            self._timestamp_cache = cache
+        return cache
+
+    def last_updated_str(self) -> str:
+        return self._timestamps()[3]
+
+    @classmethod
+    def parse_rows(
+        cls, header: Sequence[str], rows: Iterable[Sequence[str]]
+    ) -> Iterator[Tuple[int, "Event"]]:
+        """Yield ``(position, event)`` per row; malformed rows are logged and skipped."""
+        positions = {name: i for i, name in enumerate(header)}
+        columns = [positions.get(name) for name in HEADERS]
+        width = len(header)
+        for position, row in enumerate(rows):
+            try:
+                yield position, cls._from_row(columns, width, row)
+            except Exception as e:
+                logger.warning(f"Skipping malformed row {position + 1}: {e}")
+
+    @classmethod
+    def _from_row(
+        cls, columns: List[Optional[int]], width: int, row: Sequence[str]
+    ) -> "Event":
+        if len(row) < width:
+            row = list(row) + [""] * (width - len(row))
+        (
+            event_id,
+            event_name,
+            date,
+            venue,
+            city,
+            category,
+            url,
+            source,
+            status,
+            last_updated,
+            starts_at,
+            ends_at,
+        ) = ("" if i is None else str(row[i]) for i in columns)
+        if status == "Updated" or not status:
+            status = "Active"
+        return cls(
+            event_name=event_name,
+            date=date,
+            venue=venue,
+            city=city,
+            category=category,
+            url=url,
+            source=source,
+            status=status,
+            last_updated=(
+                parse_timestamp(last_updated) if last_updated else datetime.now()
+            ),
+            event_id=event_id or None,
+            starts_at=from_iso(starts_at),
+            ends_at=from_iso(ends_at),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Event":
+        header = list(data.keys())
+        positions = {name: i for i, name in enumerate(header)}
+        columns = [positions.get(name) for name in HEADERS]
+        return cls._from_row(columns, len(header), list(data.values()))
+
+    def to_row(self) -> List[str]:
+        _, _, _, last_updated, starts_at, ends_at = self._timestamps()
+        return [
+            self.event_id,
+            self.event_name,
+            self.date,
+            self.venue,
+            self.city,
+            self.category,
+            self.url,
+            self.source,
+            self.status,
+            last_updated,
+            starts_at,
+            ends_at,
+        ]
+
     def to_dict(self) -> dict:
-        return {
-            "Event ID": self.event_id,
-            "Event Name": self.event_name,
-            "Date": self.date,
-            "Venue": self.venue,
-            "City": self.city,
-            "Category": self.category,
-            "URL": self.url,
-            "Source": self.source,
-            "Status": self.status,
-            "Last Updated": self.last_updated.strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        return dict(zip(HEADERS, self.to_row()))
@@ -1,4 +1,5 @@
 from src.scrapers.base_scraper import BaseScraper
 from src.scrapers.district_scraper import DistrictScraper
+from src.scrapers.orchestrator import ScrapeOrchestrator
 
-__all__ = ["BaseScraper", "DistrictScraper"]
+__all__ = ["BaseScraper", "DistrictScraper", "ScrapeOrchestrator"]
@@ -1,23 +1,56 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-import time
-
-from bs4 import BeautifulSoup
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 from src.models.event import Event
 from src.utils.config import config
 from src.utils.logger import setup_logger
-from src.utils.helpers import retry_on_failure, make_request
+from src.utils.helpers import is_retryable, make_request, retry_after, retry_on_failure
+from src.utils.circuit_breaker import (
+    HostCircuitBreaker,
+    circuit_breaker as default_circuit_breaker,
+)
+from src.utils.fingerprints import (
+    FingerprintStore,
+    content_fingerprint,
+    get_fingerprint_store,
+)
+from src.utils.http_cache import HttpCache, get_http_cache
+from src.utils.metrics import metrics
+from src.utils.rate_limiter import HostRateLimiter, rate_limiter as default_rate_limiter
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+    from src.utils.http_client import HttpClient
 
 
 logger = setup_logger(__name__)
 
 
 class BaseScraper(ABC):
-    def __init__(self, city: str):
+    def __init__(
+        self,
+        city: str,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        http_client: Optional["HttpClient"] = None,
+        http_cache: Optional[HttpCache] = None,
+        fingerprints: Optional[FingerprintStore] = None,
+        circuit_breaker: Optional[HostCircuitBreaker] = None,
+    ):
         self.city = city
         self.config = config
         self.logger = logger
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.circuit_breaker = circuit_breaker or default_circuit_breaker
+        if http_client is None:
+            from src.utils.http_client import get_http_client
+
+            http_client = get_http_client()
+        self.http = http_client
+        self.http_cache = http_cache or get_http_cache()
+        self.fingerprints = fingerprints or get_fingerprint_store()
+        self.not_modified: Set[str] = set()
         self.events: List[Event] = []
 
     @abstractmethod
@@ -29,40 +62,113 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
-    def parse_events(self, html_content: str) -> List[Event]:
+    def get_event_links(self, html_content: str, url: str) -> Dict[str, Optional[str]]:
         pass
 
-    @retry_on_failure(max_retries=3, delay=2.0)
+    @abstractmethod
+    def scrape_event(self, link: str, venue_hint: Optional[str] = None) -> Optional[Event]:
+        pass
+
+    def get_next_page_url(self, html_content: str, url: str) -> Optional[str]:
+        return None
+
+    def limit_links(self, link_hints: Dict[str, Optional[str]], scheduled: int = 0) -> list:
+        items = list(link_hints.items())
+        if self.config.MAX_EVENTS > 0:
+            items = items[: max(self.config.MAX_EVENTS - scheduled, 0)]
+        return items
+
+    @retry_on_failure()
     def fetch_page(self, url: str) -> Optional[str]:
+        self.circuit_breaker.before_request(url)
         try:
+            cached = self.http_cache.get(url) if self.http_cache else None
+            self.rate_limiter.acquire(url)
             self.logger.info(f"Fetching: {url}")
-            response = make_request(url, timeout=self.config.REQUEST_TIMEOUT)
-            time.sleep(self.config.RATE_LIMIT_DELAY)
-            return response.text
+            with metrics.timer("fetch"):
+                response = make_request(
+                    url,
+                    timeout=self.config.REQUEST_TIMEOUT,
+                    headers=cached.conditional_headers() if cached else None,
+                    client=self.http,
+                )
         except Exception as e:
+            metrics.incr("fetch_errors")
             self.logger.error(f"Error fetching {url}: {e}")
+            if is_retryable(e):
+                metrics.incr("throttled")
+                self.circuit_breaker.record_failure(url)
+                self.rate_limiter.on_throttle(url, retry_after(e))
+            else:
+                self.circuit_breaker.record_success(url)
             raise
+        self.circuit_breaker.record_success(url)
+        self.rate_limiter.on_success(url)
+        metrics.incr("pages_fetched")
+        metrics.incr("bytes_downloaded", len(response.content))
+        if response.status_code == 304 and cached:
+            metrics.incr("cache_hits")
+            self.not_modified.add(url)
+            self.http_cache.refresh(url)
+            return cached.body
+        self.not_modified.discard(url)
+        if self.http_cache:
+            self.http_cache.put(
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response.text
 
     def scrape(self) -> List[Event]:
+        """Scrape this city on its own; crawls go through ScrapeOrchestrator directly."""
+        from src.scrapers.orchestrator import ScrapeOrchestrator
+
         try:
-            self.logger.info(f"Scraping {self.city} from {self.get_platform_name()}")
-            url = self.get_base_url()
-            if not url:
-                self.logger.warning(f"No URL for {self.city}")
-                return []
-
-            html = self.fetch_page(url)
-            if not html:
-                return []
-
-            self.events = self.parse_events(html)
-            self.logger.info(f"Found {len(self.events)} events")
+            self.events = ScrapeOrchestrator([self]).run()
             return self.events
         except Exception as e:
             self.logger.error(f"Scraping failed: {e}")
             return []
 
-    def get_soup(self, html_content: str) -> BeautifulSoup:
+    def flush_caches(self):
+        if self.http_cache:
+            self.http_cache.flush()
+        if self.fingerprints:
+            self.fingerprints.flush()
+
+    def cached_result(self, url: str) -> Optional[dict]:
+        if url not in self.not_modified or not self.http_cache:
+            return None
+        entry = self.http_cache.get(url)
+        return entry.meta if entry and entry.meta else None
+
+    def remember_result(self, url: str, **meta):
+        if self.http_cache:
+            self.http_cache.set_meta(url, meta)
+
+    def known_event(self, url: str, html_content: str) -> Optional[Event]:
+        cached = self.cached_result(url)
+        data = cached.get("event") if cached else None
+        if data is None and self.fingerprints:
+            data = self.fingerprints.match(url, content_fingerprint(html_content))
+        if data is None:
+            return None
+        metrics.incr("unchanged_events")
+        event = Event.from_dict(data)
+        event.last_updated = datetime.now()
+        return event
+
+    def remember_event(self, url: str, html_content: str, event: Event):
+        data = event.to_dict()
+        self.remember_result(url, event=data)
+        if self.fingerprints:
+            self.fingerprints.put(url, content_fingerprint(html_content), data)
+
+    def get_soup(self, html_content: str) -> "BeautifulSoup":
+        from bs4 import BeautifulSoup
+
         return BeautifulSoup(html_content, "html.parser")
 
     def validate_event(self, event: Event) -> bool:
@@ -1,10 +1,21 @@
 import re
 from datetime import datetime
-from typing import List, Optional
-import json
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urljoin, urlparse
 
 from src.scrapers.base_scraper import BaseScraper
 from src.models.event import Event
+from src.utils.dates import parse_event_date
+from src.utils.html_extract import (
+    extract_h1,
+    extract_ld_json,
+    extract_links,
+    extract_meta,
+    extract_rel_next,
+)
+from src.utils.metrics import metrics
+
+PAGE_PARAM_RE = re.compile(r"[?&]page=(\d+)")
 
 
 class DistrictScraper(BaseScraper):
@@ -15,28 +26,49 @@ class DistrictScraper(BaseScraper):
         urls = self.config.get_city_url_mapping("district")
         return urls.get(self.city, "")
 
-    def parse_events(self, html_content: str) -> List[Event]:
-        events = []
-        soup = self.get_soup(html_content)
-        link_hints = self._extract_event_links(soup)
-
-        if not link_hints:
-            self.logger.warning("No event links found")
-            return []
+    def get_event_links(self, html_content: str, url: str) -> Dict[str, Optional[str]]:
+        cached = self.cached_result(url)
+        if cached and "links" in cached:
+            return cached["links"]
+        link_hints = self._extract_event_links(html_content)
+        self.remember_result(url, links=link_hints, next_page=self._find_next_page(html_content, url))
+        return link_hints
+
+    def get_next_page_url(self, html_content: str, url: str) -> Optional[str]:
+        cached = self.cached_result(url)
+        if cached and "next_page" in cached:
+            return cached["next_page"]
+        return self._find_next_page(html_content, url)
+
+    def _find_next_page(self, html_content: str, url: str) -> Optional[str]:
+        rel_next = extract_rel_next(html_content)
+        if rel_next:
+            return urljoin(url, rel_next)
+        query = parse_qs(urlparse(url).query)
+        wanted = int(query.get("page", ["1"])[0]) + 1
+        for href, _ in extract_links(html_content):
+            match = PAGE_PARAM_RE.search(href)
+            if match and int(match.group(1)) == wanted:
+                return urljoin(url, href)
+        return None
 
-        for link, venue_hint in list(link_hints.items())[:25]:
-            try:
-                event_html = self.fetch_page(link)
-                if not event_html:
-                    continue
+    def scrape_event(self, link: str, venue_hint: Optional[str] = None) -> Optional[Event]:
+        try:
+            event_html = self.fetch_page(link)
+            if not event_html:
+                return None
+            known = self.known_event(link, event_html)
+            if known:
+                return known
+            with metrics.timer("parse"):
                 event = self._parse_event_page(event_html, link, venue_hint)
-                if event and self.validate_event(event):
-                    events.append(event)
-            except Exception as e:
-                self.logger.debug(f"Skip event: {e}")
-                continue
-
-        return events
+            if event and self.validate_event(event):
+                self.remember_event(link, event_html, event)
+                return event
+            metrics.incr("parse_failures")
+        except Exception as e:
+            self.logger.debug(f"Skip event: {e}")
+        return None
 
     def _is_valid_event_url(self, url: str) -> bool:
         url = url.split("?")[0].rstrip("/")
@@ -54,10 +86,9 @@ class DistrictScraper(BaseScraper):
             return self._parse_city_from_venue(match.group(1))
         return None
 
-    def _extract_event_links(self, soup) -> dict:
+    def _extract_event_links(self, html_content: str) -> dict:
         result = {}
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for href, text in extract_links(html_content):
             if "/artist" in href:
                 continue
             if "/events/" in href or "/event/" in href:
@@ -65,7 +96,6 @@ class DistrictScraper(BaseScraper):
                     href = f"https://www.district.in{href}"
                 if href.startswith("http") and self._is_valid_event_url(href):
                     url = href.split("?")[0]
-                    text = a.get_text(separator=" ", strip=True)
                     hint = self._extract_venue_city_from_text(text) or self._parse_city_from_venue(text)
                     result[url] = hint
         return result
@@ -83,78 +113,88 @@ class DistrictScraper(BaseScraper):
             return p
         return parts[-1] if parts else None
 
+    def _apply_ld_json(self, blocks: list, fields: dict):
+        for data in blocks:
+            try:
+                items = data if isinstance(data, list) else [data]
+                for item in items:
+                    if isinstance(item, dict) and item.get("@type") == "Event":
+                        fields["event_name"] = item.get("name", fields["event_name"])
+                        fields["date"] = item.get("startDate", fields["date"])
+                        end_date = item.get("endDate")
+                        if isinstance(end_date, str):
+                            fields["ends_at"] = parse_event_date(end_date)
+                        fields["category"] = (
+                            item.get("eventType") or item.get("genre") or fields["category"]
+                        )
+                        loc = item.get("location", {})
+                        if isinstance(loc, dict):
+                            fields["venue"] = loc.get("name") or fields["venue"]
+                            addr = loc.get("address", {})
+                            if isinstance(addr, dict):
+                                locality = addr.get("addressLocality")
+                                if locality:
+                                    fields["city"] = locality
+                                    fields["city_resolved"] = True
+                            self._apply_venue_city(fields)
+                        break
+            except Exception:
+                continue
+
+    def _apply_venue_city(self, fields: dict):
+        venue = fields["venue"]
+        if fields["city"] == self.city and venue != "TBA" and "," in venue:
+            parsed = self._parse_city_from_venue(venue)
+            if parsed:
+                fields["city"] = parsed
+                fields["city_resolved"] = True
+
+    def _extract_fields(self, html_content: str, venue_hint: Optional[str]) -> dict:
+        fields = {
+            "event_name": "Unknown Event",
+            "date": "TBA",
+            "venue": "TBA",
+            "city": venue_hint if venue_hint else self.city,
+            "category": "General",
+            "ends_at": None,
+            "city_resolved": bool(venue_hint),
+        }
+        self._apply_ld_json(extract_ld_json(html_content), fields)
+
+        if fields["event_name"] == "Unknown Event":
+            fields["event_name"] = extract_h1(html_content) or fields["event_name"]
+        if fields["date"] == "TBA" or fields["venue"] == "TBA":
+            meta = extract_meta(html_content)
+            if fields["date"] == "TBA" and meta.get("event:start_date"):
+                fields["date"] = meta["event:start_date"]
+            if fields["venue"] == "TBA" and meta.get("event:location"):
+                fields["venue"] = meta["event:location"]
+
+        self._apply_venue_city(fields)
+        return fields
+
+    def _scan_dom_for_city(self, html_content: str) -> Optional[str]:
+        soup = self.get_soup(html_content)
+        for elem in soup.find_all(["p", "div", "span"]):
+            text = elem.get_text(strip=True)
+            if "," in text and 8 < len(text) < 70:
+                parsed = self._parse_city_from_venue(text)
+                if parsed and parsed.lower() not in ("india", "tba", "free"):
+                    return parsed
+        return None
+
     def _parse_event_page(self, html_content: str, url: str, venue_hint: Optional[str] = None) -> Optional[Event]:
         try:
-            soup = self.get_soup(html_content)
-            event_name = "Unknown Event"
-            event_date = "TBA"
-            venue = "TBA"
-            city = venue_hint if venue_hint else self.city
-            category = "General"
-
-            for script in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data = json.loads(script.string or "{}")
-                    items = data if isinstance(data, list) else [data]
-                    for item in items:
-                        if isinstance(item, dict) and item.get("@type") == "Event":
-                            event_name = item.get("name", event_name)
-                            event_date = item.get("startDate", event_date)
-                            category = (
-                                item.get("eventType") or item.get("genre") or category
-                            )
-                            loc = item.get("location", {})
-                            if isinstance(loc, dict):
-                                venue = loc.get("name") or venue
-                                addr = loc.get("address", {})
-                                if isinstance(addr, dict):
-                                    locality = addr.get("addressLocality")
-                                    if locality:
-                                        city = locality
-                                if city == self.city and venue != "TBA" and "," in venue:
-                                    parsed = self._parse_city_from_venue(venue)
-                                    if parsed:
-                                        city = parsed
-                            break
-                except Exception:
-                    continue
-
-            if event_name == "Unknown Event":
-                h1 = soup.find("h1")
-                event_name = h1.get_text(strip=True) if h1 else event_name
-            if event_date == "TBA":
-                meta = soup.find("meta", property="event:start_date")
-                if meta and meta.get("content"):
-                    event_date = meta["content"]
-            if venue == "TBA":
-                meta = soup.find("meta", property="event:location")
-                if meta and meta.get("content"):
-                    venue = meta["content"]
-
-            if city == self.city and venue != "TBA" and "," in venue:
-                parsed = self._parse_city_from_venue(venue)
-                if parsed:
-                    city = parsed
-
-            if city == self.city:
-                for elem in soup.find_all(["p", "div", "span"]):
-                    text = elem.get_text(strip=True)
-                    if "," in text and 8 < len(text) < 70:
-                        parsed = self._parse_city_from_venue(text)
-                        if parsed and parsed.lower() not in ("india", "tba", "free"):
-                            city = parsed
-                            break
+            fields = self._extract_fields(html_content, venue_hint)
+            if not fields.pop("city_resolved") and fields["city"] == self.city:
+                fields["city"] = self._scan_dom_for_city(html_content) or fields["city"]
 
             return Event(
-                event_name=event_name,
-                date=event_date,
-                venue=venue,
-                city=city,
-                category=category,
                 url=url,
                 source=self.get_platform_name(),
                 status="Active",
                 last_updated=datetime.now(),
+                **fields,
             )
         except Exception as e:
             self.logger.debug(f"Parse error: {e}")
@@ -0,0 +1,160 @@
+import queue
+import threading
+from functools import partial
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+from src.models.event import Event
+from src.scrapers.base_scraper import BaseScraper
+from src.utils.config import config
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Scraped events buffered ahead of storage, in SAVE_BATCH_SIZE batches.
+RESULT_BUFFER_BATCHES = 4
+
+
+class WorkQueue:
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Callable]]" = queue.Queue()
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def put(self, key: Hashable, task: Callable) -> bool:
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+        self._queue.put(task)
+        return True
+
+    def get(self) -> Optional[Callable]:
+        return self._queue.get()
+
+    def task_done(self):
+        self._queue.task_done()
+
+    def join(self):
+        self._queue.join()
+
+    def stop(self, workers: int):
+        for _ in range(workers):
+            self._queue.put(None)
+
+
+class ScrapeOrchestrator:
+    def __init__(self, scrapers: List[BaseScraper], max_workers: int = None):
+        self.scrapers = scrapers
+        self.max_workers = max(1, max_workers or config.MAX_CONCURRENCY)
+        self._seen_ids = set()
+        self._scheduled = 0
+        # Bounded so scrapers wait for a slow storage instead of piling events up in memory.
+        self._results: "queue.Queue[Optional[Event]]" = queue.Queue(
+            maxsize=max(config.SAVE_BATCH_SIZE, 1) * RESULT_BUFFER_BATCHES
+        )
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+
+    def _group_by_listing(self) -> Dict[tuple, List[BaseScraper]]:
+        groups: Dict[tuple, List[BaseScraper]] = {}
+        for scraper in self.scrapers:
+            url = scraper.get_base_url()
+            if not url:
+                logger.warning(f"No URL for {scraper.city}")
+                continue
+            groups.setdefault((scraper.get_platform_name(), url), []).append(scraper)
+        return groups
+
+    def run(self) -> List[Event]:
+        return list(self.iter_events())
+
+    def iter_events(self) -> Iterator[Event]:
+        groups = self._group_by_listing()
+        work = WorkQueue()
+        for (platform, url), group in groups.items():
+            cities = ", ".join(s.city for s in group)
+            logger.info(f"Scraping {platform} listing {url} for {cities}")
+            work.put(("listing", url), partial(self._scrape_listing, group[0], url, work, 1))
+
+        threads = [
+            threading.Thread(target=self._worker, args=(work,), daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        for t in threads:
+            t.start()
+
+        def finish():
+            work.join()
+            work.stop(len(threads))
+            self._emit(None)
+
+        threading.Thread(target=finish, daemon=True).start()
+        count = 0
+        try:
+            while True:
+                event = self._results.get()
+                if event is None:
+                    break
+                count += 1
+                yield event
+        finally:
+            # Unblocks producers and skips queued work if the consumer stopped early.
+            self._closed.set()
+            for group in groups.values():
+                group[0].flush_caches()
+            logger.info(f"Found {count} events")
+
+    def _emit(self, event: Optional[Event]):
+        while not self._closed.is_set():
+            try:
+                self._results.put(event, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _worker(self, work: WorkQueue):
+        while True:
+            task = work.get()
+            if task is None:
+                work.task_done()
+                return
+            try:
+                if not self._closed.is_set():
+                    task()
+            except Exception as e:
+                logger.error(f"Scrape task failed: {e}")
+            finally:
+                work.task_done()
+
+    def _scrape_listing(self, scraper: BaseScraper, url: str, work: WorkQueue, page: int):
+        html = scraper.fetch_page(url)
+        if not html:
+            return
+        link_hints = scraper.get_event_links(html, url)
+        if not link_hints:
+            logger.warning(f"No event links found on {url}")
+            return
+        with self._lock:
+            items = scraper.limit_links(link_hints, self._scheduled)
+        for link, hint in items:
+            if work.put(("event", link), partial(self._scrape_event, scraper, link, hint)):
+                with self._lock:
+                    self._scheduled += 1
+        if config.MAX_EVENTS > 0 and self._scheduled >= config.MAX_EVENTS:
+            return
+        next_url = scraper.get_next_page_url(html, url)
+        if next_url and page < config.MAX_LISTING_PAGES:
+            work.put(
+                ("listing", next_url),
+                partial(self._scrape_listing, scraper, next_url, work, page + 1),
+            )
+
+    def _scrape_event(self, scraper: BaseScraper, link: str, hint: Optional[str]):
+        event = scraper.scrape_event(link, hint)
+        if not event:
+            return
+        with self._lock:
+            if event.event_id in self._seen_ids:
+                return
+            self._seen_ids.add(event.event_id)
+        self._emit(event)
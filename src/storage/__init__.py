@@ -0,0 +1,16 @@
+from src.storage.base_storage import BaseStorage
+from src.storage.google_sheets_storage import GoogleSheetsStorage
+from src.storage.sqlite_storage import SQLiteStorage
+from src.utils.config import config
+
+BACKENDS = {"sheets": GoogleSheetsStorage, "sqlite": SQLiteStorage}
+
+
+def get_storage(backend: str = None) -> BaseStorage:
+    name = (backend or config.STORAGE_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown STORAGE_BACKEND: {name}")
+    return BACKENDS[name]()
+
+
+__all__ = ["BaseStorage", "GoogleSheetsStorage", "SQLiteStorage", "get_storage"]
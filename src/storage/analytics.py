@@ -0,0 +1,93 @@
+from typing import Dict, Iterable, Optional
+
+from src.models.event import Event
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int):
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+class EventCounters:
+    def __init__(self):
+        self.total = 0
+        self.by_status: Dict[str, int] = {}
+        self.by_city: Dict[str, int] = {}
+        self.by_source: Dict[str, int] = {}
+        self.by_category: Dict[str, int] = {}
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> "EventCounters":
+        counters = cls()
+        for e in events:
+            counters.add(e)
+        return counters
+
+    def _apply(self, e: Event, status: str, delta: int):
+        _bump(self.by_status, status, delta)
+        if status == "Active":
+            _bump(self.by_city, e.city, delta)
+            _bump(self.by_category, e.category or "General", delta)
+
+    def add(self, e: Event):
+        self.total += 1
+        _bump(self.by_source, e.source, 1)
+        self._apply(e, e.status, 1)
+
+    def remove(self, e: Event):
+        self.total -= 1
+        _bump(self.by_source, e.source, -1)
+        self._apply(e, e.status, -1)
+
+    def change_status(self, e: Event, old_status: str):
+        if old_status == e.status:
+            return
+        self._apply(e, old_status, -1)
+        self._apply(e, e.status, 1)
+
+    def state(self) -> dict:
+        return {
+            "total": self.total,
+            "by_status": dict(self.by_status),
+            "by_city": dict(self.by_city),
+            "by_source": dict(self.by_source),
+            "by_category": dict(self.by_category),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "EventCounters":
+        counters = cls()
+        counters.total = state.get("total", 0)
+        counters.by_status = dict(state.get("by_status", {}))
+        counters.by_city = dict(state.get("by_city", {}))
+        counters.by_source = dict(state.get("by_source", {}))
+        counters.by_category = dict(state.get("by_category", {}))
+        return counters
+
+    def to_dict(self) -> dict:
+        return {
+            "total_events": self.total,
+            "active_events": self.by_status.get("Active", 0),
+            "expired_events": self.by_status.get("Expired", 0),
+            "by_city": dict(self.by_city),
+            "by_source": dict(self.by_source),
+            "by_category": dict(self.by_category),
+        }
+
+
+def combined_analytics(hot: dict, archived: Optional[EventCounters]) -> dict:
+    """``to_dict``-style analytics for the hot set plus the archive totals."""
+    result = dict(hot)
+    cold = archived.to_dict() if archived is not None else EventCounters().to_dict()
+    for key in ("total_events", "active_events", "expired_events"):
+        result[key] = hot[key] + cold[key]
+    for key in ("by_city", "by_source", "by_category"):
+        merged = dict(hot[key])
+        for name, count in cold[key].items():
+            merged[name] = merged.get(name, 0) + count
+        result[key] = merged
+    result["archived_events"] = cold["total_events"]
+    return result
@@ -0,0 +1,140 @@
+import gzip
+import json
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.models.event import Event
+from src.storage.analytics import EventCounters
+from src.utils.config import config
+from src.utils.dates import event_timezone
+from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+TOTALS_FILE = "totals.json"
+
+
+def partition_name(e: Event) -> str:
+    if e.starts_at is not None:
+        return e.starts_at.astimezone(event_timezone()).strftime("%Y-%m")
+    return e.last_updated.strftime("%Y-%m")
+
+
+class EventArchive:
+    """Cold storage for events moved out of the hot set.
+
+    Events are appended as gzip JSONL, one file per start month
+    (``2026-09.jsonl.gz``). Each append adds a gzip member. Next to each
+    partition, ``2026-09.ids`` lists its event ids, so an event is never
+    archived or counted twice. ``totals.json`` keeps running counters so
+    analytics never read the partitions.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or config.ARCHIVE_DIR)
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[int, EventCounters]] = None
+
+    def append(self, events: List[Event]) -> int:
+        """Archive ``events``, skipping ids already archived; returns how many were added."""
+        if not events:
+            return 0
+        groups: Dict[str, List[Event]] = defaultdict(list)
+        for e in events:
+            groups[partition_name(e)].append(e)
+        added = 0
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            state = self._read_state()
+            counters = EventCounters.from_state(state.get("counters", {}))
+            partitions = state.get("partitions", {})
+            for name, group in sorted(groups.items()):
+                known = self._partition_ids(name)
+                fresh = []
+                for e in group:
+                    if e.event_id not in known:
+                        known.add(e.event_id)
+                        fresh.append(e)
+                if not fresh:
+                    continue
+                lines = "".join(
+                    json.dumps(e.to_dict(), separators=(",", ":")) + "\n" for e in fresh
+                )
+                # Events first: a crash before the ids are written risks a duplicate, not a loss.
+                with open(self.path / f"{name}.jsonl.gz", "ab") as f:
+                    f.write(gzip.compress(lines.encode()))
+                with open(self.path / f"{name}.ids", "a") as f:
+                    f.write("".join(f"{e.event_id}\n" for e in fresh))
+                for e in fresh:
+                    counters.add(e)
+                partitions[name] = partitions.get(name, 0) + len(fresh)
+                added += len(fresh)
+            if added:
+                self._write_state({"counters": counters.state(), "partitions": partitions})
+        if added:
+            metrics.incr("events_archived", added)
+            logger.info(f"Archived {added} expired events to {self.path}")
+        return added
+
+    def _partition_ids(self, name: str) -> Set[str]:
+        try:
+            return set((self.path / f"{name}.ids").read_text().split())
+        except FileNotFoundError:
+            pass
+        if not (self.path / f"{name}.jsonl.gz").exists():
+            return set()
+        ids = {e.event_id for e in self.iter_events(name)}
+        (self.path / f"{name}.ids").write_text("".join(f"{i}\n" for i in sorted(ids)))
+        return ids
+
+    def totals(self) -> EventCounters:
+        """Counters for everything archived; re-read only when the totals file changes."""
+        try:
+            mtime = (self.path / TOTALS_FILE).stat().st_mtime_ns
+        except OSError:
+            return EventCounters()
+        cached = self._cached
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, EventCounters.from_state(self._read_state().get("counters", {})))
+            self._cached = cached
+        return cached[1]
+
+    def partitions(self) -> Dict[str, int]:
+        return dict(self._read_state().get("partitions", {}))
+
+    def iter_events(self, partition: str) -> Iterator[Event]:
+        with gzip.open(self.path / f"{partition}.jsonl.gz", "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield Event.from_dict(json.loads(line))
+
+    def _read_state(self) -> dict:
+        try:
+            return json.loads((self.path / TOTALS_FILE).read_text())
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning(f"Unreadable archive totals, recounting partitions: {e}")
+        return self._recount()
+
+    def _recount(self) -> dict:
+        counters = EventCounters()
+        partitions = {}
+        for file in sorted(self.path.glob("*.jsonl.gz")):
+            name = file.name[: -len(".jsonl.gz")]
+            seen = set()
+            for e in self.iter_events(name):
+                if e.event_id not in seen:
+                    seen.add(e.event_id)
+                    counters.add(e)
+            partitions[name] = len(seen)
+        return {"counters": counters.state(), "partitions": partitions}
+
+    def _write_state(self, state: dict):
+        tmp = self.path / f"{TOTALS_FILE}.tmp"
+        tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+        os.replace(tmp, self.path / TOTALS_FILE)
@@ -1,21 +1,99 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
 
 from src.models.event import Event
+from src.storage.analytics import EventCounters
+from src.storage.archive import EventArchive
+from src.storage.dedup import DedupIndex
+from src.utils.config import config
+from src.utils.helpers import batched, expiry_threshold
+from src.utils.metrics import metrics
 
 
 class BaseStorage(ABC):
+    def __init__(self):
+        self.counters = EventCounters()
+        self.archive = EventArchive()
+
     def merge_events(
         self, new_events: List[Event], existing_events: List[Event]
     ) -> List[Event]:
         event_dict = {e.event_id: e for e in existing_events}
-        for event in new_events:
-            if event.event_id in event_dict:
-                event_dict[event.event_id].last_updated = event.last_updated
-            else:
-                event_dict[event.event_id] = event
+        self._merge_into(event_dict, new_events, DedupIndex(existing_events))
         return list(event_dict.values())
 
+    def _merge_into(
+        self, event_dict: Dict[str, Event], new_events: List[Event], index: DedupIndex
+    ) -> List[Event]:
+        touched = []
+        with metrics.timer("merge"):
+            for event in new_events:
+                existing = event_dict.get(event.event_id) or self._duplicate_of(event, index)
+                if existing is not None:
+                    existing.last_updated = event.last_updated
+                    touched.append(existing)
+                else:
+                    event_dict[event.event_id] = event
+                    index.add(event)
+                    self.counters.add(event)
+                    touched.append(event)
+        return touched
+
+    def _duplicate_of(self, event: Event, index: DedupIndex) -> Optional[Event]:
+        match = index.find(event)
+        if match is not None:
+            metrics.incr("duplicates_merged")
+        return match
+
+    def expire_events(self, events: List[Event], days_offset: int = None) -> int:
+        if days_offset is None:
+            days_offset = config.MARK_EXPIRED_DAYS
+        now = datetime.now()
+        threshold = expiry_threshold(days_offset)
+        count = 0
+        with metrics.timer("expire"):
+            for e in events:
+                if e.status != "Active" or e.starts_at is None:
+                    continue
+                if e.starts_at < threshold:
+                    e.status = "Expired"
+                    e.last_updated = now
+                    self.counters.change_status(e, "Active")
+                    count += 1
+        return count
+
+    def archive_events(self, events: List[Event], days: int = None) -> List[Event]:
+        """Move events expired more than ``days`` ago to the archive; returns the moved events.
+
+        The caller removes them from the hot store. Events the archive already
+        holds, e.g. because last run's removal failed, are returned for removal
+        but not archived or counted again.
+        """
+        if days is None:
+            days = config.ARCHIVE_AFTER_DAYS
+        if days <= 0:
+            return []
+        cutoff = datetime.now() - timedelta(days=days)
+        with metrics.timer("archive"):
+            archived = [e for e in events if e.status == "Expired" and e.last_updated < cutoff]
+            if archived:
+                self.archive.append(archived)
+                for e in archived:
+                    self.counters.remove(e)
+        return archived
+
+    def sync_stream(self, events: Iterable[Event], batch_size: int = None) -> dict:
+        saved = 0
+        for batch in batched(events, batch_size or config.SAVE_BATCH_SIZE):
+            self.save_events(batch)
+            saved += len(batch)
+        expired = self.mark_expired_events()
+        return {"saved": saved, "expired": expired}
+
+    def wait_for_export(self):
+        """Block until background exports started by the last save have finished."""
+
     @abstractmethod
     def save_events(self, events: List[Event]) -> bool:
         pass
@@ -0,0 +1,236 @@
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from random import Random
+from datetime import date
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from src.models.event import Event
+from src.utils.config import config
+from src.utils.dates import event_timezone
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+NUMBER_RE = re.compile(r"[0-9]+")
+STOPWORDS = frozenset(
+    {"a", "an", "and", "at", "by", "feat", "featuring", "ft", "in", "of", "presents", "the", "with"}
+)
+# Venue and city values that say nothing about where an event is.
+PLACEHOLDER_TOKENS = frozenset(
+    {"announced", "be", "na", "tba", "tbc", "tbd", "to", "unknown", "venue"}
+)
+CITY_FILLER = frozenset({"city"})
+NUM_PERM = 16
+BAND_ROWS = 2
+VENUE_SIMILARITY = 0.3
+
+_PRIME = (1 << 61) - 1
+_rng = Random(1)
+_PERMUTATIONS = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+)
+
+DateKey = Union[date, str]
+BlockKey = Tuple[DateKey, Tuple[str, ...]]
+
+
+def tokens(text: str) -> FrozenSet[str]:
+    """Lowercase ASCII word tokens with accents, punctuation and stopwords removed."""
+    text = text or ""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return frozenset(TOKEN_RE.findall(text.lower())) - STOPWORDS
+
+
+@lru_cache(maxsize=4096)
+def cached_tokens(text: str) -> FrozenSet[str]:
+    """``tokens`` for values that repeat across events: venues, categories, cities."""
+    return tokens(text)
+
+
+def date_key(event: Event) -> DateKey:
+    if event.starts_at is not None:
+        return event.starts_at.astimezone(event_timezone()).date()
+    return " ".join(sorted(tokens(event.date)))
+
+
+def block_key(event: Event) -> BlockKey:
+    # Numbers in a name ("Match 12", "Vol 3") tell otherwise identical titles apart.
+    numbers = sorted({n.lstrip("0") or "0" for n in NUMBER_RE.findall(event.event_name or "")})
+    return date_key(event), tuple(numbers)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(shingles: Iterable[str]) -> Tuple[int, ...]:
+    hashes = [zlib.crc32(s.encode()) for s in shingles]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+class _Entry:
+    __slots__ = ("event", "name")
+
+    def __init__(self, event: Event, name: FrozenSet[str]):
+        self.event = event
+        self.name = name
+
+    @property
+    def venue(self) -> FrozenSet[str]:
+        """Venue tokens; empty when the venue is missing or a placeholder such as TBA."""
+        venue = cached_tokens(self.event.venue)
+        return frozenset() if venue <= PLACEHOLDER_TOKENS else venue
+
+    @property
+    def city(self) -> FrozenSet[str]:
+        return cached_tokens(self.event.city) - CITY_FILLER
+
+
+class DedupIndex:
+    """Finds an already-seen event that a new one duplicates.
+
+    Events are blocked by start date and the numbers in their name. Within a
+    block, an exact normalized name or URL is matched directly and similar
+    names are found through MinHash LSH bands over name tokens. Each candidate
+    is then checked for name similarity and a compatible venue. A block is
+    only tokenized and hashed once a new event falls into it.
+
+    Stored events come either up front as ``events`` or from ``loader``, which
+    is called once per date key the first time an event with that key is seen,
+    so a store that can query by day never has to be read in full.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Event] = (),
+        similarity: float = None,
+        loader: Optional[Callable[[DateKey], Iterable[Event]]] = None,
+    ):
+        self.similarity = config.DEDUP_SIMILARITY if similarity is None else similarity
+        self._pending: Dict[BlockKey, List[Event]] = {}
+        self._blocks: Dict[BlockKey, _Block] = {}
+        # Built on first use, so a run where every event id is already known pays nothing.
+        self._unindexed: Optional[Iterable[Event]] = events
+        self._loader = loader
+        self._loaded: Set[DateKey] = set()
+
+    def _index_existing(self):
+        events, self._unindexed = self._unindexed, None
+        for event in events:
+            self._add(event)
+
+    def _load(self, event: Event):
+        if self._unindexed is not None:
+            self._index_existing()
+        if self._loader is None:
+            return
+        key = date_key(event)
+        if key not in self._loaded:
+            self._loaded.add(key)
+            for stored in self._loader(key):
+                self._add(stored)
+
+    def add(self, event: Event):
+        if self.similarity <= 0:
+            return
+        self._load(event)
+        self._add(event)
+
+    def _add(self, event: Event):
+        key = block_key(event)
+        block = self._blocks.get(key)
+        if block is not None:
+            block.pending.append(event)
+        elif key in self._pending:
+            self._pending[key].append(event)
+        else:
+            self._pending[key] = [event]
+
+    def find(self, event: Event) -> Optional[Event]:
+        if self.similarity <= 0:
+            return None
+        self._load(event)
+        key = block_key(event)
+        block = self._blocks.get(key)
+        if block is None:
+            if key not in self._pending:
+                return None
+            block = self._blocks[key] = _Block(self._pending.pop(key))
+        probe = _Entry(event, tokens(event.event_name))
+        for entry in block.candidates(probe):
+            if self._same(probe, entry):
+                return entry.event
+        return None
+
+    def _same(self, probe: _Entry, entry: _Entry) -> bool:
+        if probe.event.url and probe.event.url == entry.event.url:
+            return True
+        if probe.city != entry.city:
+            return False
+        if jaccard(probe.name, entry.name) < self.similarity:
+            return False
+        if probe.venue and entry.venue:
+            return (
+                probe.venue <= entry.venue
+                or entry.venue <= probe.venue
+                or jaccard(probe.venue, entry.venue) >= VENUE_SIMILARITY
+            )
+        # A venue is unknown, so differing event pages are the stronger signal.
+        return not (probe.event.url and entry.event.url)
+
+
+class _Block:
+    __slots__ = ("pending", "entries", "exact", "bands")
+
+    def __init__(self, pending: List[Event]):
+        self.pending = pending
+        self.entries: List[_Entry] = []
+        self.exact: Dict[object, List[_Entry]] = defaultdict(list)
+        self.bands: Optional[Dict[Tuple[int, Tuple[int, ...]], List[_Entry]]] = None
+
+    @staticmethod
+    def _exact_keys(entry: _Entry) -> list:
+        return [entry.name, entry.event.url] if entry.event.url else [entry.name]
+
+    @staticmethod
+    def _band_keys(entry: _Entry) -> list:
+        if not entry.name:
+            return []
+        signature = minhash(entry.name)
+        return [(i, signature[i : i + BAND_ROWS]) for i in range(0, NUM_PERM, BAND_ROWS)]
+
+    def _band(self, entry: _Entry):
+        for key in self._band_keys(entry):
+            self.bands[key].append(entry)
+
+    def _index_pending(self):
+        for event in self.pending:
+            entry = _Entry(event, tokens(event.event_name))
+            self.entries.append(entry)
+            for key in self._exact_keys(entry):
+                self.exact[key].append(entry)
+            if self.bands is not None:
+                self._band(entry)
+        self.pending.clear()
+
+    def candidates(self, probe: _Entry) -> Iterator[_Entry]:
+        self._index_pending()
+        seen = set()
+        for key in self._exact_keys(probe):
+            for entry in self.exact.get(key, ()):
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    yield entry
+        if self.bands is None:
+            self.bands = defaultdict(list)
+            for entry in self.entries:
+                self._band(entry)
+        for key in self._band_keys(probe):
+            for entry in self.bands.get(key, ()):
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    yield entry
@@ -1,28 +1,67 @@
 import json
+import os
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List
-from datetime import datetime
-
-import gspread
-from google.oauth2.service_account import Credentials
+from typing import Dict, Iterable, List, Set, Tuple
 
+from src.storage.analytics import EventCounters
 from src.storage.base_storage import BaseStorage
-from src.models.event import Event
+from src.storage.dedup import DedupIndex
+from src.models.event import Event, HEADERS
 from src.utils.config import config
-from src.utils.helpers import is_date_expired, parse_date
-
-HEADERS = [
-    "Event ID",
-    "Event Name",
-    "Date",
-    "Venue",
-    "City",
-    "Category",
-    "URL",
-    "Source",
-    "Status",
-    "Last Updated",
+from src.utils.helpers import batched
+from src.utils.metrics import metrics
+
+STATUS_COL = HEADERS.index("Status")
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
 ]
+TOKEN_MIN_LIFETIME = timedelta(minutes=10)
+
+
+def rowcol_to_a1(row: int, col: int) -> str:
+    letters = ""
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return f"{letters}{row}"
+
+
+def load_cached_token(creds) -> bool:
+    path = config.GOOGLE_TOKEN_CACHE
+    if not path:
+        return False
+    try:
+        data = json.loads(Path(path).read_text())
+        expiry = datetime.fromisoformat(data["expiry"])
+    except Exception:
+        return False
+    if data.get("account") != creds.service_account_email or data.get("scopes") != SCOPES:
+        return False
+    if expiry - datetime.utcnow() < TOKEN_MIN_LIFETIME:
+        return False
+    creds.token = data["token"]
+    creds.expiry = expiry
+    return True
+
+
+def save_cached_token(creds):
+    path = config.GOOGLE_TOKEN_CACHE
+    if not path or not creds.token or not creds.expiry:
+        return
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "account": creds.service_account_email,
+        "scopes": SCOPES,
+        "token": creds.token,
+        "expiry": creds.expiry.isoformat(),
+    }
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
 
 
 class GoogleSheetsStorage(BaseStorage):
@@ -36,7 +75,13 @@ class GoogleSheetsStorage(BaseStorage):
         self.sheet_id = sheet_id or config.GOOGLE_SHEETS_ID
         self.credentials_json = credentials_json or config.GOOGLE_CREDENTIALS
         self._client = None
+        self._credentials = None
         self._worksheet = None
+        self._header: List[str] = []
+        self._row_index: Dict[str, int] = {}
+        self._row_values: Dict[str, List[str]] = {}
+        self._next_row = 2
+        self._loaded = False
 
     def _get_client(self):
         has_creds = bool(self.credentials_json)
@@ -46,125 +91,194 @@ class GoogleSheetsStorage(BaseStorage):
                 "or GOOGLE_CREDENTIALS_FILE"
             )
         if self._client is None:
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive",
-            ]
-            if self.credentials_json:
-                info = json.loads(self.credentials_json)
-                creds = Credentials.from_service_account_info(info, scopes=scopes)
+            import gspread
+            from google.oauth2.service_account import Credentials
+
+            info = json.loads(self.credentials_json)
+            creds = Credentials.from_service_account_info(info, scopes=SCOPES)
+            load_cached_token(creds)
+            self._credentials = creds
             self._client = gspread.authorize(creds)
         return self._client
 
     def _get_worksheet(self):
         if self._worksheet is None:
-            sheet = self._get_client().open_by_key(self.sheet_id)
-            try:
-                self._worksheet = sheet.worksheet("Events")
-            except Exception:
-                self._worksheet = sheet.sheet1
+            with metrics.timer("sheets_connect"):
+                client = self._get_client()
+                token = self._credentials.token
+                sheet = client.open_by_key(self.sheet_id)
+                try:
+                    self._worksheet = sheet.worksheet("Events")
+                except Exception:
+                    self._worksheet = sheet.sheet1
+            if self._credentials.token != token:
+                try:
+                    save_cached_token(self._credentials)
+                except OSError:
+                    pass
         return self._worksheet
 
+    def _row_delta(self, row_number: int, old: List[str], new: List[str]):
+        changed = [i for i, (a, b) in enumerate(zip(old, new)) if str(a) != str(b)]
+        changed.extend(range(min(len(old), len(new)), len(new)))
+        if not changed:
+            return None
+        first = min(changed)
+        if first < STATUS_COL:
+            first = 0
+        return {
+            "range": f"{rowcol_to_a1(row_number, first + 1)}:"
+            f"{rowcol_to_a1(row_number, len(new))}",
+            "values": [new[first:]],
+        }
+
+    def _write_delta(self, events: List[Event]):
+        if not self._loaded:
+            raise RuntimeError("Sheet layout unknown; read the sheet before writing")
+        ws = self._get_worksheet()
+        if self._header != HEADERS:
+            self._rewrite(events)
+            return
+        updates = []
+        appended = []
+        for e in events:
+            row = e.to_row()
+            row_number = self._row_index.get(e.event_id)
+            if row_number is None:
+                appended.append(row)
+                continue
+            delta = self._row_delta(row_number, self._row_values[e.event_id], row)
+            if delta:
+                updates.append(delta)
+            self._row_values[e.event_id] = row
+        first_new = self._next_row
+        fits_grid = first_new + len(appended) - 1 <= getattr(ws, "row_count", 0)
+        if appended and fits_grid:
+            updates.append(
+                {
+                    "range": f"A{first_new}:{rowcol_to_a1(first_new + len(appended) - 1, len(HEADERS))}",
+                    "values": appended,
+                }
+            )
+        with metrics.timer("sheets_write"):
+            if updates:
+                ws.batch_update(updates, value_input_option="RAW")
+            if appended and not fits_grid:
+                ws.append_rows(appended, value_input_option="RAW", table_range="A1")
+        metrics.incr("sheets_rows_written", len(updates) + len(appended))
+        for row in appended:
+            self._row_index[row[0]] = self._next_row
+            self._row_values[row[0]] = row
+            self._next_row += 1
+
+    def _delete_rows(self, event_ids: Set[str]):
+        """Delete the rows of ``event_ids`` in place, bottom range first, and renumber the rest."""
+        rows = sorted(self._row_index.pop(i) for i in event_ids if i in self._row_index)
+        for event_id in event_ids:
+            self._row_values.pop(event_id, None)
+        if not rows:
+            return
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        ws = self._get_worksheet()
+        with metrics.timer("sheets_write"):
+            for start, end in reversed(ranges):
+                ws.delete_rows(start, end)
+        metrics.incr("sheets_rows_deleted", len(rows))
+        self._row_index = {
+            event_id: row - bisect_left(rows, row) for event_id, row in self._row_index.items()
+        }
+        self._next_row -= len(rows)
+
+    def _rewrite(self, events: List[Event]):
+        ws = self._get_worksheet()
+        rows = [e.to_row() for e in events]
+        with metrics.timer("sheets_write"):
+            ws.clear()
+            ws.update("A1", [HEADERS] + rows, value_input_option="RAW")
+        metrics.incr("sheets_rows_written", len(rows) + 1)
+        self._header = list(HEADERS)
+        self._row_index = {row[0]: i + 2 for i, row in enumerate(rows)}
+        self._row_values = {row[0]: row for row in rows}
+        self._next_row = len(rows) + 2
+
     def save_events(self, events: List[Event]) -> bool:
         try:
-            ws = self._get_worksheet()
             existing = self.load_events()
             merged = self.merge_events(events, existing)
             for e in merged:
                 if e.status == "Updated":
                     e.status = "Active"
-            rows = [
-                [
-                    e.event_id,
-                    e.event_name,
-                    e.date,
-                    e.venue,
-                    e.city,
-                    e.category,
-                    e.url,
-                    e.source,
-                    e.status,
-                    e.last_updated.strftime("%Y-%m-%d %H:%M:%S"),
-                ]
-                for e in merged
-            ]
-            ws.clear()
-            ws.append_row(HEADERS)
-            if rows:
-                ws.update("A2", rows, value_input_option="RAW")
+            self._write_delta(merged)
             return True
         except Exception:
             raise
             return False
 
     def load_events(self) -> List[Event]:
-        try:
-            ws = self._get_worksheet()
-            records = ws.get_all_records()
-            if not records:
-                return []
-            events = []
-            for r in records:
-                try:
-                    lu = parse_date(str(r.get("Last Updated", ""))) or datetime.now()
-                    status = str(r.get("Status", ""))
-                    if status == "Updated":
-                        status = "Active"
-                    events.append(
-                        Event(
-                            event_name=str(r.get("Event Name", "")),
-                            date=str(r.get("Date", "")),
-                            venue=str(r.get("Venue", "")),
-                            city=str(r.get("City", "")),
-                            category=str(r.get("Category", "")),
-                            url=str(r.get("URL", "")),
-                            source=str(r.get("Source", "")),
-                            status=status,
-                            event_id=str(r.get("Event ID", "")),
-                            last_updated=lu,
-                        )
-                    )
-                except Exception:
-                    continue
-            return events
-        except Exception:
-            return []
+        """Read every row and the row layout; raises on read errors.
+
+        A failed read must never look like an empty sheet: writers would
+        rewrite it, and the API would publish an empty snapshot.
+        """
+        ws = self._get_worksheet()
+        with metrics.timer("sheets_read"):
+            values = ws.get_all_values()
+        self._header = values[0] if values else []
+        self._next_row = max(len(values), 1) + 1
+        self._loaded = True
+        numbered = [(n, row) for n, row in enumerate(values[1:], start=2) if any(row)]
+        events = []
+        self._row_index = {}
+        self._row_values = {}
+        for position, event in Event.parse_rows(self._header, (row for _, row in numbered)):
+            row_number, row = numbered[position]
+            events.append(event)
+            self._row_index[event.event_id] = row_number
+            self._row_values[event.event_id] = row
+        self.counters = EventCounters.from_events(events)
+        return events
+
+    def _expire_and_write(self, events: List[Event], changed: bool) -> Tuple[int, List[Event]]:
+        """Expire and archive ``events``, then delete archived rows and write the rest.
+
+        Returns the expired count and the events left in the sheet.
+        """
+        expired = self.expire_events(events)
+        archived = {e.event_id for e in self.archive_events(events)}
+        if archived:
+            events = [e for e in events if e.event_id not in archived]
+            self._delete_rows(archived)
+        if changed or expired or archived:
+            self._write_delta(events)
+        return expired, events
 
     def mark_expired_events(self) -> int:
         try:
-            events = self.load_events()
-            count = 0
-            for e in events:
-                if e.status == "Active" and is_date_expired(
-                    e.date, config.MARK_EXPIRED_DAYS
-                ):
-                    e.status = "Expired"
-                    e.last_updated = datetime.now()
-                    count += 1
-            if count:
-                self.save_events(events)
-            return count
+            return self._expire_and_write(self.load_events(), changed=False)[0]
         except Exception:
             return 0
 
-    def get_analytics(self) -> dict:
-        events = self.load_events()
-        active = [e for e in events if e.status == "Active"]
-        by_city = {}
-        for e in active:
-            by_city[e.city] = by_city.get(e.city, 0) + 1
-        by_source = {}
-        for e in events:
-            by_source[e.source] = by_source.get(e.source, 0) + 1
-        by_category = {}
-        for e in active:
-            cat = e.category or "General"
-            by_category[cat] = by_category.get(cat, 0) + 1
-        return {
-            "total_events": len(events),
-            "active_events": len(active),
-            "expired_events": len([e for e in events if e.status == "Expired"]),
-            "by_city": by_city,
-            "by_source": by_source,
-            "by_category": by_category,
-        }
+    def sync_stream(self, events: Iterable[Event], batch_size: int = None) -> dict:
+        existing = self.load_events()
+        if self._header != HEADERS:
+            self._rewrite(existing)
+        event_dict = {e.event_id: e for e in existing}
+        index = DedupIndex(existing)
+        saved = 0
+        for batch in batched(events, batch_size or config.SAVE_BATCH_SIZE):
+            self._write_delta(self._merge_into(event_dict, batch, index))
+            saved += len(batch)
+        expired, events = self._expire_and_write(list(event_dict.values()), changed=False)
+        return {"saved": saved, "expired": expired, "events": events}
+
+    def export_events(self, events: List[Event]):
+        self.load_events()
+        ids = {e.event_id for e in events}
+        # Rows archived or removed at the source.
+        self._delete_rows({event_id for event_id in self._row_index if event_id not in ids})
+        self._write_delta(events)
@@ -0,0 +1,237 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from src.models.event import Event, TIMESTAMP_FORMAT
+from src.storage.analytics import EventCounters
+from src.storage.base_storage import BaseStorage
+from src.storage.dedup import DateKey, DedupIndex, date_key
+from src.utils.config import config
+from src.utils.dates import event_timezone, from_iso, parse_event_date, to_utc_iso
+from src.utils.helpers import batched, expiry_threshold
+from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+COLUMNS = [
+    "event_id",
+    "event_name",
+    "date",
+    "venue",
+    "city",
+    "category",
+    "url",
+    "source",
+    "status",
+    "last_updated",
+    "starts_at",
+    "ends_at",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    venue TEXT NOT NULL,
+    city TEXT NOT NULL,
+    category TEXT NOT NULL,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    starts_at TEXT,
+    ends_at TEXT
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS ix_events_city ON events (city COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS ix_events_status ON events (status);
+CREATE INDEX IF NOT EXISTS ix_events_date ON events (date);
+CREATE INDEX IF NOT EXISTS ix_events_status_starts ON events (status, starts_at);
+CREATE INDEX IF NOT EXISTS ix_events_starts ON events (starts_at);
+"""
+
+UPSERT = f"""
+INSERT INTO events ({", ".join(COLUMNS)})
+VALUES ({", ".join("?" for _ in COLUMNS)})
+ON CONFLICT(event_id) DO UPDATE SET last_updated = excluded.last_updated
+"""
+
+
+class SQLiteStorage(BaseStorage):
+    def __init__(self, path: str = None, export_to_sheets: bool = None):
+        super().__init__()
+        self.path = path or config.SQLITE_PATH
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.export_to_sheets = (
+            config.SHEETS_EXPORT if export_to_sheets is None else export_to_sheets
+        )
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+        self._conn.executescript(INDEXES)
+        self._lock = threading.RLock()
+        self._export_thread: Optional[threading.Thread] = None
+        self._exporter = None
+
+    def _migrate(self):
+        existing = {r[1] for r in self._conn.execute("PRAGMA table_info(events)")}
+        added = [c for c in ("starts_at", "ends_at") if c not in existing]
+        if not added:
+            return
+        with self._conn:
+            for column in added:
+                self._conn.execute(f"ALTER TABLE events ADD COLUMN {column} TEXT")
+            rows = self._conn.execute("SELECT event_id, date FROM events").fetchall()
+            self._conn.executemany(
+                "UPDATE events SET starts_at = ? WHERE event_id = ?",
+                [(to_utc_iso(parse_event_date(date)) or None, eid) for eid, date in rows],
+            )
+
+    def _row(self, e: Event) -> tuple:
+        row = e.to_row()
+        return tuple(row[:-2]) + (row[-2] or None, row[-1] or None)
+
+    def _event(self, row: tuple) -> Event:
+        data = dict(zip(COLUMNS, row))
+        data["last_updated"] = datetime.strptime(data["last_updated"], TIMESTAMP_FORMAT)
+        data["starts_at"] = from_iso(data["starts_at"])
+        data["ends_at"] = from_iso(data["ends_at"])
+        return Event(**data)
+
+    def _upsert(self, events: List[Event]):
+        with metrics.timer("sqlite_write"):
+            self._conn.executemany(UPSERT, [self._row(e) for e in events])
+
+    def _expire(self) -> int:
+        threshold = to_utc_iso(expiry_threshold(config.MARK_EXPIRED_DAYS))
+        with metrics.timer("expire"):
+            cursor = self._conn.execute(
+                "UPDATE events SET status = 'Expired', last_updated = ? "
+                "WHERE status = 'Active' AND starts_at IS NOT NULL AND starts_at < ?",
+                (datetime.now().strftime(TIMESTAMP_FORMAT), threshold),
+            )
+        return cursor.rowcount
+
+    def _archive(self) -> int:
+        if config.ARCHIVE_AFTER_DAYS <= 0:
+            return 0
+        cutoff = datetime.now() - timedelta(days=config.ARCHIVE_AFTER_DAYS)
+        rows = self._conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM events "
+            "WHERE status = 'Expired' AND last_updated < ?",
+            (cutoff.strftime(TIMESTAMP_FORMAT),),
+        ).fetchall()
+        archived = self.archive_events([self._event(r) for r in rows])
+        self._conn.executemany(
+            "DELETE FROM events WHERE event_id = ?", [(e.event_id,) for e in archived]
+        )
+        return len(archived)
+
+    def _select(self, where: str, params: Sequence = ()) -> List[Event]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM events WHERE {where}", params
+            ).fetchall()
+        return [self._event(r) for r in rows]
+
+    def _dedup_index(self) -> DedupIndex:
+        """A DedupIndex fed one local day at a time from the starts_at index."""
+        undated: Optional[Dict[DateKey, List[Event]]] = None
+
+        def load(key: DateKey) -> List[Event]:
+            nonlocal undated
+            if isinstance(key, date):
+                start = datetime.combine(key, datetime.min.time(), tzinfo=event_timezone())
+                return self._select(
+                    "starts_at >= ? AND starts_at < ?",
+                    (to_utc_iso(start), to_utc_iso(start + timedelta(days=1))),
+                )
+            if undated is None:
+                undated = defaultdict(list)
+                for e in self._select("starts_at IS NULL"):
+                    undated[date_key(e)].append(e)
+            return undated.pop(key, [])
+
+        return DedupIndex(loader=load)
+
+    def _merge_batch(self, events: List[Event], index: DedupIndex) -> List[Event]:
+        stored: Dict[str, Event] = {}
+        for ids in batched(list({e.event_id for e in events}), 500):
+            placeholders = ", ".join("?" for _ in ids)
+            stored.update(
+                (e.event_id, e) for e in self._select(f"event_id IN ({placeholders})", ids)
+            )
+        return self._merge_into(stored, events, index)
+
+    def save_events(self, events: List[Event]) -> bool:
+        touched = self._merge_batch(events, self._dedup_index())
+        with self._lock, self._conn:
+            self._upsert(touched)
+        self._export()
+        return True
+
+    def load_events(self) -> List[Event]:
+        events = self._all_events()
+        self.counters = EventCounters.from_events(events)
+        return events
+
+    def _all_events(self) -> List[Event]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM events ORDER BY rowid"
+            ).fetchall()
+        return [self._event(r) for r in rows]
+
+    def mark_expired_events(self) -> int:
+        with self._lock, self._conn:
+            count = self._expire()
+            archived = self._archive()
+        if count or archived:
+            self._export()
+        return count
+
+    def sync_stream(self, events: Iterable[Event], batch_size: int = None) -> dict:
+        index = self._dedup_index()
+        saved = 0
+        for batch in batched(events, batch_size or config.SAVE_BATCH_SIZE):
+            touched = self._merge_batch(batch, index)
+            with self._lock, self._conn:
+                self._upsert(touched)
+            saved += len(batch)
+        with self._lock, self._conn:
+            expired = self._expire()
+            self._archive()
+        self._export()
+        return {"saved": saved, "expired": expired}
+
+    def _export(self):
+        if not self.export_to_sheets:
+            return
+        self.wait_for_export()
+        self._export_thread = threading.Thread(target=self._export_to_sheets)
+        self._export_thread.start()
+
+    def _export_to_sheets(self):
+        from src.storage.google_sheets_storage import GoogleSheetsStorage
+
+        try:
+            # One exporter per storage, so its client and worksheet survive between saves.
+            if self._exporter is None:
+                self._exporter = GoogleSheetsStorage()
+            self._exporter.export_events(self._all_events())
+        except Exception as e:
+            logger.error(f"Sheets export failed: {e}")
+
+    def wait_for_export(self):
+        if self._export_thread is not None:
+            self._export_thread.join()
+            self._export_thread = None
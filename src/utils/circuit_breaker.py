@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import deque
+from typing import Dict
+from urllib.parse import urlparse
+
+from src.utils.config import config
+from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        error_rate: float,
+        min_requests: int,
+        cooldown: float,
+        window: int = 20,
+    ):
+        self.name = name
+        self.error_rate = error_rate
+        self.min_requests = max(min_requests, 1)
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=max(window, self.min_requests))
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    raise CircuitOpenError(f"Circuit open for {self.name}")
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                raise CircuitOpenError(f"Circuit half-open for {self.name}, probe in flight")
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit closed for {self.name}")
+                self._outcomes.clear()
+            self.state = self.CLOSED
+            self._probing = False
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(False)
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+            if self.state != self.CLOSED or len(self._outcomes) < self.min_requests:
+                return
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.error_rate:
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        metrics.incr("circuit_opened")
+        logger.warning(
+            f"Circuit open for {self.name}: shedding requests for {self.cooldown:g}s"
+        )
+
+
+class HostCircuitBreaker:
+    def __init__(
+        self,
+        error_rate: float = None,
+        min_requests: int = None,
+        cooldown: float = None,
+    ):
+        self.error_rate = config.CIRCUIT_ERROR_RATE if error_rate is None else error_rate
+        self.min_requests = config.CIRCUIT_MIN_REQUESTS if min_requests is None else min_requests
+        self.cooldown = config.CIRCUIT_COOLDOWN if cooldown is None else cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    host, self.error_rate, self.min_requests, self.cooldown
+                )
+            return self._breakers[host]
+
+    def before_request(self, url: str):
+        try:
+            self.breaker(url).before_request()
+        except CircuitOpenError:
+            metrics.incr("circuit_rejected")
+            raise
+
+    def record_success(self, url: str):
+        self.breaker(url).record_success()
+
+    def record_failure(self, url: str):
+        self.breaker(url).record_failure()
+
+
+circuit_breaker = HostCircuitBreaker()
@@ -23,17 +23,70 @@ class Config:
             "Kochi",
         ]
 
+        self.STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "sheets")  # sheets | sqlite
+        self.SQLITE_PATH = os.getenv(
+            "SQLITE_PATH", str(self.BASE_DIR / "data" / "events.db")
+        )
+        self.SHEETS_EXPORT = os.getenv("SHEETS_EXPORT", "").lower() in ("1", "true", "yes")
+
+        self.SCRAPE_CITIES = [
+            c.strip()
+            for c in os.getenv("SCRAPE_CITIES", self.DEFAULT_CITY).split(",")
+            if c.strip()
+        ]
+
         self.GOOGLE_SHEETS_ID = os.getenv("GOOGLE_SHEETS_ID", "")
         self.GOOGLE_CREDENTIALS = os.getenv("GOOGLE_CREDENTIALS", "")  # JSON string
+        self.GOOGLE_TOKEN_CACHE = os.getenv(
+            "GOOGLE_TOKEN_CACHE", str(self.BASE_DIR / ".cache" / "google_token.json")
+        )  # empty = disabled
 
         self.MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
+        self.RETRY_BACKOFF = float(os.getenv("RETRY_BACKOFF", 1))
+        self.RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", 60))
         self.REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 30))
         self.RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", 2))
+        self.RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", 1))
+        self.RATE_LIMIT_MIN_DELAY = float(os.getenv("RATE_LIMIT_MIN_DELAY", self.RATE_LIMIT_DELAY))
+        self.RATE_LIMIT_MAX_DELAY = float(os.getenv("RATE_LIMIT_MAX_DELAY", 30))
+        self.CIRCUIT_ERROR_RATE = float(os.getenv("CIRCUIT_ERROR_RATE", 0.5))
+        self.CIRCUIT_MIN_REQUESTS = int(os.getenv("CIRCUIT_MIN_REQUESTS", 10))
+        self.CIRCUIT_COOLDOWN = float(os.getenv("CIRCUIT_COOLDOWN", 60))
+        self.MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", 4))
+        self.MAX_EVENTS = int(os.getenv("MAX_EVENTS", 0))  # 0 = no cap
+        self.MAX_LISTING_PAGES = int(os.getenv("MAX_LISTING_PAGES", 10))
+        self.SAVE_BATCH_SIZE = int(os.getenv("SAVE_BATCH_SIZE", 50))
+
+        self.HTTP_CACHE_DIR = os.getenv(
+            "HTTP_CACHE_DIR", str(self.BASE_DIR / ".cache" / "http")
+        )  # empty = disabled
+        self.HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", 100))
+        self.HTTP_CACHE_TTL_HOURS = float(os.getenv("HTTP_CACHE_TTL_HOURS", 72))
+        self.FINGERPRINT_FILE = os.getenv(
+            "FINGERPRINT_FILE", str(self.BASE_DIR / ".cache" / "fingerprints.json")
+        )  # empty = disabled
+        self.METRICS_FILE = os.getenv(
+            "METRICS_FILE", str(self.BASE_DIR / ".cache" / "metrics.json")
+        )  # empty = disabled
 
         self.PLATFORMS = [
             p.strip() for p in os.getenv("PLATFORMS", "district").split(",")
         ]
         self.MARK_EXPIRED_DAYS = int(os.getenv("MARK_EXPIRED_DAYS", 0))
+        self.ARCHIVE_AFTER_DAYS = int(
+            os.getenv("ARCHIVE_AFTER_DAYS", 30)
+        )  # 0 = keep expired events in the hot set
+        self.ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", str(self.BASE_DIR / "data" / "archive"))
+        self.DEDUP_SIMILARITY = float(
+            os.getenv("DEDUP_SIMILARITY", 0.6)
+        )  # 0 = match on event_id only
+        self.EVENT_TIMEZONE = os.getenv("EVENT_TIMEZONE", "Asia/Kolkata")
+
+        self.API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", 300))
+        self.API_TOKEN = os.getenv("API_TOKEN", "")
+        self.API_INVALIDATE_URL = os.getenv("API_INVALIDATE_URL", "")
+        self.SCRAPE_INTERVAL_MINUTES = float(os.getenv("SCRAPE_INTERVAL_MINUTES", 0))  # 0 = off
+        self.SCRAPE_ON_STARTUP = os.getenv("SCRAPE_ON_STARTUP", "true").lower() in ("1", "true", "yes")
 
     def get_city_url_mapping(self, platform: str) -> dict:
         if platform == "district":
@@ -43,6 +96,16 @@ class Config:
             }
         return {}
 
+    def get_scrape_cities(self) -> list:
+        if [c.lower() for c in self.SCRAPE_CITIES] == ["all"]:
+            cities = list(self.SUPPORTED_CITIES)
+        else:
+            cities = list(self.SCRAPE_CITIES)
+        if self.DEFAULT_CITY in cities:
+            cities.remove(self.DEFAULT_CITY)
+            cities.insert(0, self.DEFAULT_CITY)
+        return cities
+
     def validate_city(self, city: str) -> bool:
         return city in self.SUPPORTED_CITIES
 
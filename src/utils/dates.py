@@ -0,0 +1,50 @@
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Optional
+
+from src.utils.config import config
+
+UNKNOWN_DATES = {"", "tba", "tbd", "unknown"}
+
+
+@lru_cache(maxsize=1)
+def event_timezone() -> tzinfo:
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(config.EVENT_TIMEZONE)
+    except Exception:
+        return timezone.utc
+
+
+@lru_cache(maxsize=8192)
+def parse_event_date(date_string: Optional[str]) -> Optional[datetime]:
+    if not date_string or date_string.strip().lower() in UNKNOWN_DATES:
+        return None
+    try:
+        parsed = datetime.fromisoformat(date_string.strip())
+    except ValueError:
+        from dateutil import parser
+
+        try:
+            parsed = parser.parse(date_string)
+        except Exception:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=event_timezone())
+    return parsed
+
+
+def to_utc_iso(value: Optional[datetime]) -> str:
+    if value is None:
+        return ""
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def from_iso(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_event_date(value)
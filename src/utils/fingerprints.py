@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.utils.config import config
+from src.utils.html_extract import LD_JSON_RE
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def content_fingerprint(html: str) -> str:
+    blocks = LD_JSON_RE.findall(html)
+    text = "\n".join(b.strip() for b in blocks) if blocks else html
+    normalized = WHITESPACE_RE.sub(" ", text).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+class FingerprintStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            self._entries: Dict[str, dict] = json.loads(self.path.read_text())
+        except Exception:
+            self._entries = {}
+
+    def match(self, url: str, fingerprint: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry and entry.get("hash") == fingerprint:
+            return entry.get("event")
+        return None
+
+    def put(self, url: str, fingerprint: str, event: dict):
+        with self._lock:
+            self._entries[url] = {"hash": fingerprint, "event": event}
+            self._dirty = True
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._entries))
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+_default_store: Optional[FingerprintStore] = None
+_default_lock = threading.Lock()
+
+
+def get_fingerprint_store() -> Optional[FingerprintStore]:
+    global _default_store
+    if not config.FINGERPRINT_FILE:
+        return None
+    with _default_lock:
+        if _default_store is None:
+            _default_store = FingerprintStore(config.FINGERPRINT_FILE)
+        return _default_store
@@ -1,46 +1,119 @@
+import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, TypeVar
 
-import requests
-from fake_useragent import UserAgent
+from src.utils.config import config
+from src.utils.dates import parse_event_date
+from src.utils.logger import setup_logger
+from src.utils.metrics import metrics
 
+if TYPE_CHECKING:
+    import requests
 
-def retry_on_failure(max_retries: int = 3, delay: float = 2.0):
+logger = setup_logger(__name__)
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def is_retryable(error: Exception) -> bool:
+    import requests
+
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+        return status == 429 or status >= 500
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def retry_on_failure(
+    max_retries: int = None,
+    delay: float = None,
+    max_delay: float = None,
+    retry_if: Callable[[Exception], bool] = is_retryable,
+):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_error = None
-            for attempt in range(max_retries):
+            attempts = max(max_retries or config.MAX_RETRIES, 1)
+            base = config.RETRY_BACKOFF if delay is None else delay
+            cap = config.RETRY_MAX_DELAY if max_delay is None else max_delay
+            for attempt in range(attempts):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        time.sleep(delay * (attempt + 1))
-            raise last_error
+                    if attempt == attempts - 1 or not retry_if(e):
+                        raise
+                    wait = max(backoff_delay(attempt, base, cap), retry_after(e) or 0.0)
+                    metrics.incr("retries")
+                    metrics.incr("retry_wait_seconds", wait)
+                    logger.warning(
+                        f"{func.__name__} failed ({e}); retry {attempt + 1}/"
+                        f"{attempts - 1} in {wait:.1f}s"
+                    )
+                    time.sleep(wait)
 
         return wrapper
 
     return decorator
 
 
+T = TypeVar("T")
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, max(size, 1)))
+        if not batch:
+            return
+        yield batch
+
+
 def get_user_agent() -> str:
+    from src.utils.http_client import FALLBACK_USER_AGENT, get_http_client
+
     try:
-        return UserAgent().random
+        return get_http_client().user_agents.next()
     except Exception:
-        return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        return FALLBACK_USER_AGENT
 
 
 def make_request(
-    url: str, timeout: int = 30, headers: Optional[dict] = None
-) -> requests.Response:
-    if headers is None:
-        headers = {"User-Agent": get_user_agent()}
-    response = requests.get(url, timeout=timeout, headers=headers)
-    response.raise_for_status()
-    return response
+    url: str, timeout: int = 30, headers: Optional[dict] = None, client=None
+) -> "requests.Response":
+    from src.utils.http_client import get_http_client
+
+    return (client or get_http_client()).get(url, timeout=timeout, headers=headers)
 
 
 def parse_date(date_string: str) -> Optional[datetime]:
@@ -52,9 +125,12 @@ def parse_date(date_string: str) -> Optional[datetime]:
         return None
 
 
+def expiry_threshold(days_offset: int = 0) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=days_offset)
+
+
 def is_date_expired(date_string: str, days_offset: int = 0) -> bool:
-    date_obj = parse_date(date_string)
+    date_obj = parse_event_date(date_string)
     if not date_obj:
         return False
-    threshold = datetime.now() + timedelta(days=days_offset)
-    return date_obj < threshold
+    return date_obj < expiry_threshold(days_offset)
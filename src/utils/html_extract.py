@@ -0,0 +1,75 @@
+import html
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+LD_JSON_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+META_RE = re.compile(r"<meta\b([^>]*)>", re.IGNORECASE)
+ANCHOR_RE = re.compile(r"<a\b([^>]*)>(.*?)</a\s*>", re.IGNORECASE | re.DOTALL)
+LINK_TAG_RE = re.compile(r"<(?:link|a)\b([^>]*)>", re.IGNORECASE)
+H1_RE = re.compile(r"<h1\b[^>]*>(.*?)</h1\s*>", re.IGNORECASE | re.DOTALL)
+ATTR_RE = re.compile(
+    r"([\w:.-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))", re.DOTALL
+)
+TAG_RE = re.compile(r"<[^>]+>")
+SKIP_BLOCK_RE = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+
+def parse_attrs(fragment: str) -> Dict[str, str]:
+    attrs = {}
+    for name, dq, sq, bare in ATTR_RE.findall(fragment):
+        attrs[name.lower()] = html.unescape(dq or sq or bare)
+    return attrs
+
+
+def inner_text(fragment: str, separator: str = "") -> str:
+    fragment = SKIP_BLOCK_RE.sub("", fragment)
+    parts = (html.unescape(p).strip() for p in TAG_RE.split(fragment))
+    return separator.join(p for p in parts if p)
+
+
+def extract_ld_json(content: str) -> List[Any]:
+    blocks = []
+    for raw in LD_JSON_RE.findall(content):
+        try:
+            blocks.append(json.loads(raw or "{}"))
+        except ValueError:
+            continue
+    return blocks
+
+
+def extract_meta(content: str) -> Dict[str, str]:
+    meta = {}
+    for fragment in META_RE.findall(content):
+        attrs = parse_attrs(fragment)
+        key = attrs.get("property") or attrs.get("name")
+        if key and attrs.get("content") and key not in meta:
+            meta[key] = attrs["content"]
+    return meta
+
+
+def extract_h1(content: str) -> Optional[str]:
+    match = H1_RE.search(content)
+    return inner_text(match.group(1)) if match else None
+
+
+def extract_links(content: str) -> List[Tuple[str, str]]:
+    links = []
+    for attrs_fragment, body in ANCHOR_RE.findall(content):
+        href = parse_attrs(attrs_fragment).get("href")
+        if href:
+            links.append((href, inner_text(body, separator=" ")))
+    return links
+
+
+def extract_rel_next(content: str) -> Optional[str]:
+    for fragment in LINK_TAG_RE.findall(content):
+        attrs = parse_attrs(fragment)
+        if "next" in attrs.get("rel", "").lower().split() and attrs.get("href"):
+            return attrs["href"]
+    return None
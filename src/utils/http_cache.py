@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.utils.config import config
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+    meta: dict = field(default_factory=dict)
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: Path, max_bytes: int, ttl_seconds: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._index: Dict[str, dict] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load_index(self):
+        try:
+            self._index = json.loads((self.directory / self.INDEX_FILE).read_text())
+        except Exception:
+            self._index = {}
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        now = time.time()
+        for key, info in list(self._index.items()):
+            if now - info["stored_at"] > self.ttl_seconds:
+                self._remove(key)
+        total = sum(info["size"] for info in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, info in sorted(self._index.items(), key=lambda kv: kv[1]["accessed"]):
+            self._remove(key)
+            total -= info["size"]
+            if total <= self.max_bytes:
+                break
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        key = self._key(url)
+        with self._lock:
+            info = self._index.get(key)
+            if not info:
+                return None
+            if time.time() - info["stored_at"] > self.ttl_seconds:
+                self._remove(key)
+                return None
+            try:
+                data = json.loads(self._path(key).read_text())
+            except Exception:
+                self._remove(key)
+                return None
+            info["accessed"] = time.time()
+        return CacheEntry(**data)
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        meta: Optional[dict] = None,
+    ):
+        if not etag and not last_modified:
+            return
+        entry = CacheEntry(url, body, etag, last_modified, meta=meta or {})
+        payload = json.dumps(entry.__dict__)
+        key = self._key(url)
+        with self._lock:
+            self._path(key).write_text(payload)
+            now = time.time()
+            self._index[key] = {
+                "size": len(payload),
+                "stored_at": entry.stored_at,
+                "accessed": now,
+            }
+            self._evict()
+
+    def refresh(self, url: str):
+        key = self._key(url)
+        with self._lock:
+            if key in self._index:
+                self._index[key]["stored_at"] = time.time()
+                self._index[key]["accessed"] = time.time()
+
+    def set_meta(self, url: str, meta: dict):
+        entry = self.get(url)
+        if entry is None:
+            return
+        entry.meta.update(meta)
+        payload = json.dumps(entry.__dict__)
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return
+            self._path(key).write_text(payload)
+            self._index[key]["size"] = len(payload)
+
+    def flush(self):
+        with self._lock:
+            self._evict()
+            tmp = self.directory / f"{self.INDEX_FILE}.tmp"
+            tmp.write_text(json.dumps(self._index))
+            os.replace(tmp, self.directory / self.INDEX_FILE)
+
+
+_default_cache: Optional[HttpCache] = None
+_default_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    global _default_cache
+    if not config.HTTP_CACHE_DIR:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache(
+                config.HTTP_CACHE_DIR,
+                max_bytes=config.HTTP_CACHE_MAX_MB * 1024 * 1024,
+                ttl_seconds=config.HTTP_CACHE_TTL_HOURS * 3600,
+            )
+        return _default_cache
@@ -0,0 +1,107 @@
+import itertools
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from src.utils.config import config
+from src.utils.metrics import metrics
+
+FALLBACK_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+@lru_cache(maxsize=1)
+def load_user_agents(size: int = 20) -> List[str]:
+    try:
+        from fake_useragent import UserAgent
+
+        ua = UserAgent()
+        agents = list(dict.fromkeys(ua.random for _ in range(size)))
+        return agents or [FALLBACK_USER_AGENT]
+    except Exception:
+        return [FALLBACK_USER_AGENT]
+
+
+class UserAgentPool:
+    def __init__(self, agents: Optional[List[str]] = None):
+        self._cycle = itertools.cycle(agents or load_user_agents())
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            return next(self._cycle)
+
+
+class HttpClient:
+    def __init__(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        user_agents: Optional[UserAgentPool] = None,
+    ):
+        pool_maxsize = pool_maxsize or max(config.MAX_CONCURRENCY, 10)
+        self.user_agents = user_agents or UserAgentPool()
+        self.session = requests.Session()
+        self.session.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections or 10, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_downloaded = 0
+
+    def get(
+        self, url: str, timeout: int = 30, headers: Optional[dict] = None
+    ) -> requests.Response:
+        merged = {"User-Agent": self.user_agents.next()}
+        if headers:
+            merged.update(headers)
+        response = self.session.get(url, timeout=timeout, headers=merged)
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += len(response.content)
+        response.raise_for_status()
+        return response
+
+    def stats(self) -> dict:
+        opened = 0
+        served = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            served += pool.num_requests
+        return {
+            "requests": self.requests,
+            "connections_opened": opened,
+            "connections_reused": max(served - opened, 0),
+            "bytes_downloaded": self.bytes_downloaded,
+        }
+
+    def publish_stats(self, since: dict):
+        """Add the connection counters accrued since the ``since`` stats to the run metrics."""
+        current = self.stats()
+        for name in ("connections_opened", "connections_reused"):
+            metrics.incr(name, max(current[name] - since.get(name, 0), 0))
+
+    def close(self):
+        self.session.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,107 @@
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.counters: Dict[str, float] = {}
+            self.timers: Dict[str, Dict[str, float]] = {}
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            timer = self.timers.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            timer["count"] += 1
+            timer["total"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            timers = {
+                name: {
+                    "count": t["count"],
+                    "total_seconds": round(t["total"], 6),
+                    "max_seconds": round(t["max"], 6),
+                }
+                for name, t in self.timers.items()
+            }
+            started_at = self.started_at
+        elapsed = time.time() - started_at
+        return {
+            "started_at": started_at,
+            "elapsed_seconds": round(elapsed, 3),
+            "pages_per_second": round(counters.get("pages_fetched", 0) / elapsed, 3)
+            if elapsed > 0
+            else 0.0,
+            "counters": counters,
+            "timers": timers,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix: str = "event_scraper") -> str:
+        return render_prometheus(self.summary(), prefix)
+
+    def write_report(self, path: str):
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(self.to_json())
+        target.with_suffix(".prom").write_text(self.to_prometheus())
+
+
+def render_prometheus(summary: dict, prefix: str = "event_scraper") -> str:
+    lines = []
+    for name, value in sorted(summary.get("counters", {}).items()):
+        metric = f"{prefix}_{_metric_name(name)}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for name, t in sorted(summary.get("timers", {}).items()):
+        metric = f"{prefix}_{_metric_name(name)}_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count {t['count']}")
+        lines.append(f"{metric}_sum {t['total_seconds']}")
+        lines.append(f"# TYPE {metric}_max gauge")
+        lines.append(f"{metric}_max {t['max_seconds']}")
+    for name in ("elapsed_seconds", "pages_per_second"):
+        if name in summary:
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {summary[name]}")
+    return "\n".join(lines) + "\n"
+
+
+def load_report(path: str) -> Optional[dict]:
+    try:
+        return json.loads(Path(path).read_text())
+    except Exception:
+        return None
+
+
+metrics = Metrics()
@@ -0,0 +1,108 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from src.utils.config import config
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, until: float):
+        if self.rate > 0 and until > self._updated:
+            self._tokens = min(
+                self.capacity, self._tokens + (until - self._updated) * self.rate
+            )
+        self._updated = max(self._updated, until)
+
+    def acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._blocked_until)
+            if self.rate <= 0:
+                wait = start - now
+            else:
+                self._refill(start)
+                self._tokens -= 1
+                wait = start - now
+                if self._tokens < 0:
+                    wait += -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class HostRateLimiter:
+    """Per-host token buckets whose rate adapts to how the host is responding.
+
+    Healthy responses raise the rate additively towards one request per
+    ``min_delay`` seconds; throttling (429/5xx) halves it, down to one request
+    per ``max_delay`` seconds, and a ``Retry-After`` pauses the host outright.
+    """
+
+    INCREASE_STEP = 0.1
+    DECREASE_FACTOR = 0.5
+
+    def __init__(
+        self,
+        delay: float,
+        burst: int = 1,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+    ):
+        self.rate = 1.0 / delay if delay > 0 else 0.0
+        self.burst = burst
+        min_delay = delay if min_delay is None else min(min_delay, delay)
+        max_delay = delay if max_delay is None else max(max_delay, delay)
+        self.max_rate = 1.0 / min_delay if min_delay > 0 else self.rate
+        self.min_rate = 1.0 / max_delay if max_delay > 0 else self.rate
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        return self.bucket(url).acquire()
+
+    def on_success(self, url: str):
+        if self.rate <= 0:
+            return
+        bucket = self.bucket(url)
+        if bucket.rate < self.max_rate:
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.rate * self.INCREASE_STEP))
+
+    def on_throttle(self, url: str, retry_after: Optional[float] = None):
+        bucket = self.bucket(url)
+        if self.rate > 0:
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.DECREASE_FACTOR))
+        if retry_after:
+            bucket.pause(retry_after)
+
+
+rate_limiter = HostRateLimiter(
+    config.RATE_LIMIT_DELAY,
+    config.RATE_LIMIT_BURST,
+    config.RATE_LIMIT_MIN_DELAY,
+    config.RATE_LIMIT_MAX_DELAY,
+)
@@ -0,0 +1,34 @@
+from src.models.event import Event
+from src.storage.dedup import DedupIndex
+
+
+def event(name, venue, city, url, date="2026-11-14 19:00"):
+    return Event(name, date, venue, city, "Music", url, "district")
+
+
+def index_of(*events) -> DedupIndex:
+    return DedupIndex(events, similarity=0.6)
+
+
+def test_merges_reformatted_copy_of_same_event():
+    stored = event("Arijit Singh Live", "NSCI Dome", "Mumbai", "https://x/arijit")
+    copy = event("Arijit Singh - Live!", "NSCI Dome, Worli", "mumbai", "https://x/arijit-live")
+    assert index_of(stored).find(copy) is stored
+
+
+def test_placeholder_venues_in_different_cities_are_not_merged():
+    stored = event("Sunburn Arena Tour", "TBA", "Pune", "https://x/sunburn-pune")
+    other = event("Sunburn Arena Tour", "TBA", "Delhi", "https://x/sunburn-delhi")
+    assert index_of(stored).find(other) is None
+
+
+def test_placeholder_venue_with_different_urls_is_not_merged():
+    stored = event("Sunburn Arena Tour", "TBA", "Pune", "https://x/sunburn-1")
+    other = event("Sunburn Arena Tour", "Venue TBD", "Pune", "https://x/sunburn-2")
+    assert index_of(stored).find(other) is None
+
+
+def test_unknown_venue_without_conflicting_url_still_merges():
+    stored = event("Sunburn Arena Tour", "", "Pune", "https://x/sunburn")
+    other = event("Sunburn Arena Tour", "TBA", "Pune City", "")
+    assert index_of(stored).find(other) is stored
@@ -0,0 +1,51 @@
+from starlette.requests import Request
+
+from api.cache import EventSnapshot
+from api.responses import snapshot_response
+from src.models.event import Event
+
+
+def request(**headers) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+def snapshot() -> EventSnapshot:
+    events = [
+        Event(f"Show {i}", "2026-11-14 19:00", "Hall", "Pune", "Music", f"https://x/{i}", "x")
+        for i in range(50)
+    ]
+    return EventSnapshot(events)
+
+
+def respond(snap, **headers):
+    return snapshot_response(
+        request(**headers), snap, ("events",), lambda: [e.to_dict() for e in snap.events]
+    )
+
+
+def test_encoded_response_revalidates_with_its_own_etag():
+    snap = snapshot()
+    first = respond(snap, accept_encoding="gzip")
+    assert first.headers["content-encoding"] == "gzip"
+    etag = first.headers["etag"]
+    assert etag.endswith('-gzip"')
+
+    again = respond(snap, accept_encoding="gzip", if_none_match=etag)
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.headers["vary"] == "Accept-Encoding"
+
+
+def test_identity_and_encoded_etags_differ():
+    snap = snapshot()
+    identity = respond(snap).headers["etag"]
+    assert identity != respond(snap, accept_encoding="gzip").headers["etag"]
+    assert respond(snap, if_none_match=identity).status_code == 304
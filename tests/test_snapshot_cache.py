@@ -0,0 +1,36 @@
+from api.cache import SnapshotCache
+from src.models.event import HEADERS, Event
+from src.storage.google_sheets_storage import GoogleSheetsStorage
+
+
+class FlakyWorksheet:
+    def __init__(self, values):
+        self.values = values
+        self.failing = False
+
+    def get_all_values(self):
+        if self.failing:
+            raise IOError("503 Service Unavailable")
+        return self.values
+
+
+def sheets_storage(worksheet) -> GoogleSheetsStorage:
+    storage = GoogleSheetsStorage()
+    storage._worksheet = worksheet
+    return storage
+
+
+def test_failed_read_keeps_serving_last_snapshot():
+    event = Event("Comedy Night", "2026-11-14", "Canvas", "Mumbai", "Comedy", "", "district")
+    worksheet = FlakyWorksheet([HEADERS, event.to_row()])
+    cache = SnapshotCache(sheets_storage(worksheet).load_events, ttl=0)
+    published = []
+    cache.add_listener(lambda old, new: published.append(new))
+
+    first = cache.get()
+    assert [e.event_id for e in first.events] == [event.event_id]
+
+    worksheet.failing = True
+    assert cache.refresh() is first
+    assert cache.get().events == first.events
+    assert published == [first]
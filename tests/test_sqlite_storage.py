@@ -0,0 +1,33 @@
+import sqlite3
+
+from src.storage.sqlite_storage import SQLiteStorage
+
+
+def columns(storage: SQLiteStorage) -> set:
+    return {r[1] for r in storage._conn.execute("PRAGMA table_info(events)")}
+
+
+def test_new_database_has_start_and_end_columns():
+    assert {"starts_at", "ends_at"} <= columns(SQLiteStorage(":memory:", export_to_sheets=False))
+
+
+def test_old_database_is_migrated(tmp_path):
+    path = str(tmp_path / "events.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE events (event_id TEXT PRIMARY KEY, event_name TEXT NOT NULL, "
+        "date TEXT NOT NULL, venue TEXT NOT NULL, city TEXT NOT NULL, "
+        "category TEXT NOT NULL, url TEXT NOT NULL, source TEXT NOT NULL, "
+        "status TEXT NOT NULL, last_updated TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO events VALUES ('e1', 'Gig', '2026-11-14 19:00', 'Hall', 'Pune', "
+        "'Music', 'https://x/gig', 'district', 'Active', '2026-10-01 10:00:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    storage = SQLiteStorage(path, export_to_sheets=False)
+    assert {"starts_at", "ends_at"} <= columns(storage)
+    (event,) = storage.load_events()
+    assert event.starts_at is not None